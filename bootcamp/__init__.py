@@ -0,0 +1,35 @@
+# The bootcamp scripts as an importable package
+# Importing a module here only defines its functions and classes: the examples that the
+# scripts used to run at import time are each module's main(), run with
+#     python -m bootcamp.branching
+# (the dated scripts at the top of the repository do the same). NumPy is imported on
+# first use (see _lazy.py), and submodules are imported when first accessed, so
+# "import bootcamp" costs next to nothing. python -m bootcamp.importtime checks that
+# every module stays within its import-time budget.
+
+import importlib
+
+__all__ = [
+    "array_expressions",
+    "array_store",
+    "branching",
+    "dictionaries",
+    "exception_handling",
+    "functions",
+    "indexing",
+    "inheritance",
+    "input_providers",
+    "introduction",
+    "linear_algebra",
+    "lists",
+    "output_sink",
+    "random_streams",
+    "sets",
+    "tuples",
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,41 @@
+# Optional heavy dependencies, imported on first use
+# numpy, pandas, matplotlib and torch each take 100 ms or more to import, which every
+# worker process would pay even when it never touches them. A module that may use one
+# writes np = optional_import("numpy") instead of import numpy as np: the name is None
+# when the package is not installed, so the usual "if np is not None" fallbacks keep
+# working, and otherwise it is a placeholder module that runs the real import on its
+# first attribute access.
+
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    def __getattr__(self, attr):
+        # Only called for names not in __dict__, that is until the first import
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)  # later lookups are plain attribute reads
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return f"<lazy module {self.__name__!r}>"
+
+
+def _installed(name):
+    # Ask the import finders directly (importlib.util alone costs several milliseconds);
+    # only the top-level package is looked up, so no package code runs here
+    top_level = name.partition(".")[0]
+    for finder in sys.meta_path:
+        find_spec = getattr(finder, "find_spec", None)
+        if find_spec is not None and find_spec(top_level, None) is not None:
+            return True
+    return False
+
+
+def optional_import(name):
+    if name in sys.modules:
+        return sys.modules[name]  # None if the import has been blocked
+    if not _installed(name):
+        return None
+    return LazyModule(name)
@@ -0,0 +1,292 @@
+# Lazy element-wise array expressions
+# In the NumPy notes every step of a formula such as (a + b) * c - sqrt(a) allocates a
+# full-size temporary, so a 10^8-element formula with five steps needs five extra arrays
+# and streams each of them through memory. Here the same code records the steps instead:
+#
+#     a, b, c = lazy(a), lazy(b), lazy(c)
+#     result = ((a + b) * c - np.sqrt(a)).evaluate()      # or .evaluate(out=existing)
+#
+# Operators and NumPy ufuncs applied to a LazyArray build a graph of nodes and only check
+# shapes (with the usual broadcasting rules) and result dtypes. evaluate() then runs the
+# whole graph once per block of about block_size elements, so the intermediate values
+# live in a few cache-sized scratch buffers and only the result is a full-size array.
+# With out=..., not even that: the result is written into an existing array, which
+# replaces the in-place recipe (array += 1 is lazy(array) + 1 evaluated with out=array).
+
+from math import prod
+
+from ._lazy import optional_import
+
+np = optional_import("numpy")  # needed by everything here, imported on first use
+
+BLOCK_SIZE = 1 << 15  # elements per block: a float64 scratch buffer is 256 KiB
+
+
+class LazyArray:
+    # A leaf (op is None, args is the wrapped array) or an operation on other nodes and
+    # scalars; op is called as op(*values, out=buffer) for one block at a time
+    __slots__ = ("op", "args", "shape", "dtype")
+
+    def __init__(self, op, args, shape, dtype):
+        self.op = op
+        self.args = args
+        self.shape = shape
+        self.dtype = dtype
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return prod(self.shape)
+
+    def __repr__(self):
+        name = "leaf" if self.op is None else getattr(self.op, "__name__", repr(self.op))
+        return f"LazyArray({name}, shape={self.shape}, dtype={self.dtype})"
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # np.sqrt(x), np.maximum(x, 0) and ndarray + LazyArray all end up here
+        if method != "__call__" or kwargs or ufunc.nout != 1:
+            return NotImplemented
+        return apply(ufunc, *inputs)
+
+    def evaluate(self, out=None, block_size=BLOCK_SIZE):
+        return evaluate(self, out=out, block_size=block_size)
+
+    def sum(self, block_size=BLOCK_SIZE):
+        # Sum of every element, block by block, without materializing the expression
+        partials = [np.add.reduce(block, axis=None) for block in _iter_blocks(self, block_size)]
+        return np.add.reduce(np.array(partials), axis=None) if partials else self.dtype.type(0)
+
+
+def _operator(name, reflected=False):
+    # Operator method that looks up the ufunc when called, so NumPy stays unimported
+    if reflected:
+        return lambda self, other: apply(getattr(np, name), other, self)
+    return lambda self, other: apply(getattr(np, name), self, other)
+
+
+_BINARY_OPERATORS = {
+    "add": "add", "sub": "subtract", "mul": "multiply", "truediv": "true_divide",
+    "floordiv": "floor_divide", "mod": "remainder", "pow": "power",
+    "and": "bitwise_and", "or": "bitwise_or", "xor": "bitwise_xor",
+}
+for _name, _ufunc in _BINARY_OPERATORS.items():
+    setattr(LazyArray, f"__{_name}__", _operator(_ufunc))
+    setattr(LazyArray, f"__r{_name}__", _operator(_ufunc, reflected=True))
+for _name, _ufunc in {"lt": "less", "le": "less_equal", "gt": "greater", "ge": "greater_equal",
+                      "eq": "equal", "ne": "not_equal"}.items():
+    setattr(LazyArray, f"__{_name}__", _operator(_ufunc))
+LazyArray.__neg__ = lambda self: apply(np.negative, self)
+LazyArray.__pos__ = lambda self: self
+LazyArray.__abs__ = lambda self: apply(np.absolute, self)
+LazyArray.__invert__ = lambda self: apply(np.invert, self)
+LazyArray.__hash__ = object.__hash__  # __eq__ builds a node, identity is still the hash
+
+
+def lazy(array):
+    # Wrap an array (or anything np.asarray accepts) as a leaf of an expression
+    if isinstance(array, LazyArray):
+        return array
+    array = np.asarray(array)
+    return LazyArray(None, array, array.shape, array.dtype)
+
+
+def _sample(arg):
+    # A one-element stand-in used to find the result dtype of an operation
+    if isinstance(arg, LazyArray):
+        return np.ones(1, dtype=arg.dtype)
+    return arg
+
+
+def apply(op, *args):
+    # Node for op(*args); args are LazyArrays, arrays (wrapped as leaves) or scalars.
+    # op must accept out= like a ufunc does.
+    args = tuple(arg if isinstance(arg, LazyArray) or np.isscalar(arg) else lazy(arg) for arg in args)
+    shape = np.broadcast_shapes(*(arg.shape for arg in args if isinstance(arg, LazyArray)))
+    with np.errstate(all="ignore"):
+        dtype = np.asarray(op(*map(_sample, args))).dtype
+    return LazyArray(op, args, shape, dtype)
+
+
+def _where(condition, x, y, out=None):
+    # np.where has no out=; the temporary it makes is only one block
+    if out is None:
+        return np.where(condition, x, y)
+    out[...] = np.where(condition, x, y)
+    return out
+
+
+def where(condition, x, y):
+    # Lazy np.where(condition, x, y)
+    return apply(_where, condition, x, y)
+
+
+def _plan(root):
+    # Turn the graph into a list of steps, children before parents, where every value is
+    # a reference ("leaf", i), ("buffer", i) or ("scalar", value). Scratch buffers are
+    # handed back to a per-dtype free list as soon as their last reader has run, so a
+    # deep formula still needs only a few of them.
+    leaves, steps, buffers = [], [], []  # buffers: dtype of each scratch buffer
+    refs, readers = {}, {}
+    order, seen = [], set()
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
+            continue
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if node.op is None:
+            refs[id(node)] = ("leaf", len(leaves))
+            leaves.append(node.args)
+            continue
+        stack.append((node, True))  # popped again once all its arguments are done
+        for arg in node.args:
+            if isinstance(arg, LazyArray):
+                readers[id(arg)] = readers.get(id(arg), 0) + 1
+                stack.append((arg, False))
+    free = {}
+    for node in order:
+        args = tuple(refs[id(arg)] if isinstance(arg, LazyArray) else ("scalar", arg) for arg in node.args)
+        for arg in node.args:
+            if isinstance(arg, LazyArray):
+                readers[id(arg)] -= 1
+                kind, index = refs[id(arg)]
+                if kind == "buffer" and readers[id(arg)] == 0:
+                    free.setdefault(buffers[index], []).append(index)
+        if node is root:
+            target = None  # written straight into the output block
+        elif free.get(node.dtype):
+            target = free[node.dtype].pop()
+        else:
+            target = len(buffers)
+            buffers.append(node.dtype)
+        refs[id(node)] = ("buffer", target)
+        steps.append((node.op, args, target))
+    return leaves, steps, buffers
+
+
+def _blocks(shape, block_size):
+    # Index tuples that cut shape into blocks of at most about block_size elements: a
+    # range along one axis, every axis after it whole, one position on the axes before it
+    inner, axis = 1, len(shape)
+    while axis > 0 and inner * shape[axis - 1] <= block_size:
+        axis -= 1
+        inner *= shape[axis]
+    if axis == 0:
+        return [()], shape
+    length = shape[axis - 1]
+    step = max(1, block_size // inner)
+    blocks = (prefix + (slice(start, min(start + step, length)),)
+              for prefix in np.ndindex(*shape[:axis - 1])
+              for start in range(0, length, step))
+    return blocks, (min(step, length),) + shape[axis:]
+
+
+def _run(root, shape, block_size, out_blocks=None):
+    # Evaluate root, broadcast to shape, block by block and yield (index, block). Each
+    # block is written into out_blocks(index), or into a reused scratch buffer.
+    leaves, steps, buffer_dtypes = _plan(root)
+    views = [np.broadcast_to(leaf, shape) for leaf in leaves]  # read-only, no copies
+    blocks, block_shape = _blocks(shape, block_size)
+    scratch = [np.empty(block_shape, dtype=dtype) for dtype in buffer_dtypes]
+    if out_blocks is None:
+        scratch_out = np.empty(block_shape, dtype=root.dtype)
+    for index in blocks:
+        leaf_blocks = [view[index] for view in views]
+        rows = index[-1].stop - index[-1].start if index else block_shape[0] if block_shape else None
+        if rows is None or rows == block_shape[0]:
+            buffers = scratch
+        else:  # the last, shorter block of a run
+            buffers = [buffer[:rows] for buffer in scratch]
+        if out_blocks is not None:
+            out = out_blocks(index)
+        else:
+            out = scratch_out if buffers is scratch else scratch_out[:rows]
+        for op, args, target in steps:
+            values = [leaf_blocks[i] if kind == "leaf" else buffers[i] if kind == "buffer" else i
+                      for kind, i in args]
+            op(*values, out=out if target is None else buffers[target])
+        yield index, out
+
+
+def _iter_blocks(expression, block_size):
+    if expression.op is None:
+        yield np.asarray(expression.args)
+        return
+    for _, block in _run(expression, expression.shape, block_size):
+        yield block
+
+
+def _same_layout(a, b):
+    return (a.shape == b.shape and a.strides == b.strides
+            and a.__array_interface__["data"][0] == b.__array_interface__["data"][0])
+
+
+def evaluate(expression, out=None, block_size=BLOCK_SIZE):
+    # Compute expression into out (a new array by default) in one blocked pass
+    expression = lazy(expression)
+    if out is None:
+        out = np.empty(expression.shape, dtype=expression.dtype)
+    elif np.broadcast_shapes(out.shape, expression.shape) != out.shape:
+        raise ValueError(f"cannot write a result of shape {expression.shape} into an array of shape {out.shape}")
+    if expression.op is None:
+        np.copyto(out, expression.args)
+        return out
+    # Reading and writing the same elements block by block is safe; any other overlap
+    # with out (a shifted view of it, say) is read from a copy instead
+    leaves, _, _ = _plan(expression)
+    for leaf in leaves:
+        if np.may_share_memory(leaf, out) and not _same_layout(leaf, out):
+            return evaluate(_replace_leaf(expression, leaf, leaf.copy()), out=out, block_size=block_size)
+    for _ in _run(expression, out.shape, block_size, lambda index: out[index] if index else out):
+        pass
+    return out
+
+
+def _replace_leaf(node, old, new):
+    if node.op is None:
+        return lazy(new) if node.args is old else node
+    args = tuple(_replace_leaf(arg, old, new) if isinstance(arg, LazyArray) else arg for arg in node.args)
+    return LazyArray(node.op, args, node.shape, node.dtype)
+
+
+def benchmark_expression(size=10 ** 7, block_size=BLOCK_SIZE):
+    # Time and peak extra memory of one formula, eager NumPy vs. the lazy blocked version
+    import time
+    import tracemalloc
+
+    rng = np.random.default_rng(0)
+    a, b, c = (rng.random(size) for _ in range(3))
+    formulas = (
+        ("eager", lambda: (a + b) * c - np.sqrt(a) / (b + 1)),
+        ("lazy", lambda: ((lazy(a) + b) * c - np.sqrt(lazy(a)) / (lazy(b) + 1)).evaluate(block_size=block_size)),
+    )
+    for label, formula in formulas:
+        tracemalloc.start()
+        start = time.perf_counter()
+        formula()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{label:<6} {elapsed * 1e3:8.1f} ms, peak {peak / a.nbytes:4.2f}x the size of one input")
+
+
+def main():
+    array1 = np.array([1, 2, 3])
+    array2 = np.array([[10], [20]])
+    print(evaluate(lazy(array1) + array2))  # Output: [[11 12 13] [21 22 23]]
+    array = np.array([1, 2, 3, 4, 5])
+    evaluate(lazy(array) + 1, out=array)  # array += 1 without a temporary
+    print(array)  # Output: [2 3 4 5 6]
+    x = lazy(np.linspace(0, 1, 5))
+    print(where(x > 0.5, x * 2, -x).evaluate())  # Output: [-0.   -0.25 -0.5   1.5   2.  ]
+    print((x * x).sum())  # Output: 1.875
+
+
+if __name__ == "__main__":
+    main()
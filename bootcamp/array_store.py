@@ -0,0 +1,198 @@
+# Memory-mapped .npy files
+# np.load("array.npy") reads the whole file into memory, and every worker process that
+# loads it gets its own copy. np.load(path, mmap_mode="r") maps the file instead: pages
+# are read from disk when they are first touched, and all the processes that map the same
+# file share one copy in the page cache. ArrayStore adds the other half, writing:
+#
+#     store = ArrayStore.create("features.npy", dtype="float32", row_shape=(64,))
+#     store.append(rows)                 # grows the file along the first axis
+#     features = store.open()            # read-only np.memmap of every row so far
+#     results = map_rows(score, "features.npy", workers=8)
+#
+# The files are ordinary .npy files (np.load reads them). NumPy's header writer leaves
+# room for the row count to grow to 21 digits, so an append writes the new rows at the
+# end of the file and then rewrites the header in place. The header is rewritten last,
+# so a reader never sees rows that were not completely written. Maps opened before an
+# append keep their old length; open() again to see the new rows.
+
+import os
+from math import prod
+
+from ._lazy import optional_import
+
+np = optional_import("numpy")  # needed by everything here, imported on first use
+
+CHUNK_ROWS = 1 << 16  # rows converted and written per chunk
+
+
+def _header(dtype, shape):
+    return {"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": shape}
+
+
+def _read_header(file):
+    # (shape, dtype, offset of the data) of an open .npy file
+    version = np.lib.format.read_magic(file)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+    else:
+        raise ValueError(f"unsupported .npy format version {version}")
+    if fortran_order:
+        raise ValueError("rows can only be appended to C-ordered arrays")
+    return shape, dtype, file.tell()
+
+
+class ArrayStore:
+    def __init__(self, path):
+        # Open an existing .npy file, created by create() or by np.save
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as file:
+            self.shape, self.dtype, self.offset = _read_header(file)
+        if not self.shape:
+            raise ValueError(f"{self.path} holds a 0-d array, which has no rows")
+
+    @classmethod
+    def create(cls, path, dtype, row_shape=(), overwrite=False):
+        # New empty store of rows shaped row_shape
+        dtype = np.dtype(dtype)
+        with open(path, "wb" if overwrite else "xb") as file:
+            np.lib.format.write_array_header_1_0(file, _header(dtype, (0,) + tuple(row_shape)))
+        return cls(path)
+
+    def __len__(self):
+        return self.shape[0]
+
+    @property
+    def row_shape(self):
+        return self.shape[1:]
+
+    def _write_header(self, file, rows):
+        shape = (rows,) + self.row_shape
+        file.seek(0)
+        np.lib.format.write_array_header_1_0(file, _header(self.dtype, shape))
+        if file.tell() != self.offset:  # a header that did not leave room to grow
+            raise ValueError(f"the header of {self.path} cannot be updated in place")
+        self.shape = shape
+
+    def append(self, rows, chunk_rows=CHUNK_ROWS):
+        # Add rows (one row, or an array of them) at the end of the file. Rows are converted
+        # to the store's dtype chunk_rows at a time, so appending a huge array (a memmap of
+        # another file, say) never makes a full-size copy.
+        rows = np.asarray(rows)
+        if rows.shape == self.row_shape:
+            rows = rows[np.newaxis]
+        if rows.shape[1:] != self.row_shape:
+            raise ValueError(f"rows of shape {rows.shape[1:]} do not match the store's {self.row_shape}")
+        if not np.can_cast(rows.dtype, self.dtype, "same_kind"):
+            raise TypeError(f"cannot append {rows.dtype} rows to a {self.dtype} store")
+        if not len(rows):
+            return self
+        with open(self.path, "r+b") as file:
+            self.shape = _read_header(file)[0]  # another ArrayStore may have appended
+            file.seek(self.offset + len(self) * self.dtype.itemsize * prod(self.row_shape))
+            for start in range(0, len(rows), chunk_rows):
+                file.write(np.ascontiguousarray(rows[start:start + chunk_rows], dtype=self.dtype))
+            file.flush()
+            self._write_header(file, len(self) + len(rows))
+        return self
+
+    def extend(self, chunks, chunk_rows=CHUNK_ROWS):
+        # Append a stream of row blocks (a generator of arrays, for example)
+        for chunk in chunks:
+            self.append(chunk, chunk_rows)
+        return self
+
+    def write_rows(self, start, rows, chunk_rows=CHUNK_ROWS):
+        # Overwrite existing rows from start on, chunk by chunk through a writable map
+        rows = np.asarray(rows)
+        target = self.open("r+")
+        if start < 0 or start + len(rows) > len(target):
+            raise IndexError(f"rows {start}..{start + len(rows)} are outside the store's {len(target)} rows")
+        for first in range(0, len(rows), chunk_rows):
+            chunk = rows[first:first + chunk_rows]
+            target[start + first:start + first + len(chunk)] = chunk
+        target.flush()
+        del target
+
+    def open(self, mode="r"):
+        # np.memmap of the current rows: "r" read-only, "r+" writes go to the file, "c"
+        # copy-on-write (changes stay in this process)
+        return np.load(self.path, mmap_mode=mode)
+
+
+def save_array(path, array, chunk_rows=CHUNK_ROWS):
+    # np.save for arrays that do not fit in memory: writes array (a memmap, say) in chunks
+    array = np.asanyarray(array)
+    if array.ndim == 0:
+        np.save(path, array)
+    else:
+        ArrayStore.create(path, array.dtype, array.shape[1:], overwrite=True).append(array, chunk_rows)
+
+
+def load_array(path, mode="r"):
+    # np.load that maps the file instead of reading it
+    return np.load(path, mmap_mode=mode)
+
+
+# Worker processes map the file once, in the pool initializer, and then only receive
+# (start, stop) bounds: the rows themselves are never pickled or copied
+_worker_rows = None
+
+
+def _init_rows_worker(path):
+    global _worker_rows
+    _worker_rows = np.load(path, mmap_mode="r")
+
+
+def _apply_to_rows(task):
+    func, start, stop = task
+    return func(_worker_rows[start:stop])
+
+
+def map_rows(func, path, workers=None, chunk_rows=CHUNK_ROWS):
+    # [func(rows[start:stop]) for every chunk of chunk_rows rows], computed in worker
+    # processes that share one read-only map of the file. func must be picklable, a
+    # module-level function for example.
+    from concurrent.futures import ProcessPoolExecutor
+
+    rows = len(ArrayStore(path))
+    tasks = [(func, start, min(start + chunk_rows, rows)) for start in range(0, rows, chunk_rows)]
+    with ProcessPoolExecutor(workers, initializer=_init_rows_worker, initargs=(os.fspath(path),)) as pool:
+        return list(pool.map(_apply_to_rows, tasks))
+
+
+def _column_sums(rows):
+    return rows.sum(axis=0)
+
+
+def benchmark_load(rows=25_000, columns=1000):
+    # Loading vs. mapping a file (200 MB by default) and reading one row from it
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "big.npy")
+        save_array(path, np.ones((rows, columns)))
+        for label, load in (("np.load", np.load), ("mmap_mode='r'", load_array)):
+            start = time.perf_counter()
+            load(path)[rows // 2].sum()
+            print(f"{label:<14} {(time.perf_counter() - start) * 1e3:8.2f} ms")
+
+
+def main():
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "array.npy")
+        store = ArrayStore.create(path, "float64", row_shape=(3,))
+        store.append([1.0, 2.0, 3.0])
+        store.extend(np.arange(12.0).reshape(2, 2, 3))
+        print(len(store), store.open()[-1])  # Output: 5 [ 9. 10. 11.]
+        print(np.load(path).shape)  # Output: (5, 3), still a normal .npy file
+        print(sum(map_rows(_column_sums, path, workers=2, chunk_rows=2)))  # Output: [19. 24. 29.]
+
+
+# Worker processes import this module to find _apply_to_rows, so the demo only runs here
+if __name__ == "__main__":
+    main()
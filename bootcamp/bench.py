@@ -0,0 +1,40 @@
+# Benchmarks of the package
+# Every module's main() only runs its examples, which take a moment. The timings that
+# compare the optimized paths with the naive ones take seconds to minutes, so they are
+# the module's benchmark_* functions and only run from here:
+#
+#     python -m bootcamp.bench                   # every benchmark of every module
+#     python -m bootcamp.bench branching sets    # the benchmarks of these modules only
+
+import importlib
+import sys
+
+from . import __all__ as MODULES
+
+
+def benchmarks(module):
+    # The benchmark_* functions of a module, in the order they are defined
+    return [value for name, value in vars(module).items() if name.startswith("benchmark_") and callable(value)]
+
+
+def run_benchmarks(modules=MODULES):
+    for name in modules:
+        module = importlib.import_module(f"{__package__}.{name}")
+        for benchmark in benchmarks(module):
+            print(f"== {name}.{benchmark.__name__}", flush=True)
+            benchmark()
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    unknown = [name for name in args if name not in MODULES]
+    if unknown:
+        print(f"unknown modules: {', '.join(unknown)} (expected some of {', '.join(MODULES)})", file=sys.stderr)
+        return 2
+    run_benchmarks(args or MODULES)
+    return 0
+
+
+# Benchmarks that start process pools import their own module in the workers, never this one
+if __name__ == "__main__":
+    sys.exit(main())
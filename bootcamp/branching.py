@@ -0,0 +1,478 @@
+# Branching in Python is done using if, elif, and else statements
+# It allows the program to take different paths based on conditions
+
+import operator
+import os
+import sys
+import time
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import compress, cycle
+from math import isqrt
+
+from ._lazy import optional_import
+from .output_sink import stdout_sink
+
+np = optional_import("numpy")  # NumPy is optional, bytearray flags are used without it
+
+# Example 1: Basic if-else branching
+def check_even_odd(number):
+    # Check if the number is even
+    if number % 2 == 0:
+        return "Even"
+    else:
+        return "Odd"
+
+# Example 2: if-elif-else branching
+def grade_score(score):
+    # Check the score and assign a grade
+    if score >= 90:
+        return "A"
+    elif score >= 80:
+        return "B"
+    elif score >= 70:
+        return "C"
+    elif score >= 60:
+        return "D"
+    else:
+        return "F"
+
+# Example 3: Nested if statements
+def check_age_category(age):
+    # Determine the age category
+    if age >= 0:
+        if age < 13:
+            return "Child"
+        elif age < 20:
+            return "Teenager"
+        else:
+            return "Adult"
+    else:
+        return "Invalid age"
+
+# Examples 2 and 3 for whole arrays: the if/elif chains become sorted cut points, and
+# np.searchsorted finds every row's bracket in one call. The result is a small integer
+# code per row that indexes into the matching labels tuple.
+GRADE_CUTS = (60, 70, 80, 90)
+GRADE_LABELS = ("F", "D", "C", "B", "A")
+AGE_CUTS = (0, 13, 20)
+AGE_LABELS = ("Invalid age", "Child", "Teenager", "Adult")
+
+def _bracket_codes(values, cuts):
+    # Code i means cuts[i - 1] <= value < cuts[i]; NaN fails every >= check, like the scalar
+    # versions, so it gets code 0
+    if np is None:
+        return [0 if value != value else bisect_right(cuts, value) for value in values]
+    values = np.asarray(values)
+    codes = np.searchsorted(np.array(cuts), values, side="right").astype(np.int8)
+    if values.dtype.kind == "f":
+        codes[np.isnan(values)] = 0
+    return codes
+
+def grade_scores(scores):
+    # Vectorized grade_score: returns codes into GRADE_LABELS
+    return _bracket_codes(scores, GRADE_CUTS)
+
+def categorize_ages(ages):
+    # Vectorized check_age_category: returns codes into AGE_LABELS
+    return _bracket_codes(ages, AGE_CUTS)
+
+def _category_series(series, codes, labels):
+    import pandas as pd  # only needed by the Series adapters
+
+    categories = pd.Categorical.from_codes(codes, categories=list(labels), ordered=True)
+    return pd.Series(categories, index=series.index, name=series.name)
+
+def grade_scores_series(series):
+    # pandas adapter for grade_scores, returns a Series with category dtype
+    return _category_series(series, grade_scores(series.to_numpy()), GRADE_LABELS)
+
+def categorize_ages_series(series):
+    # pandas adapter for categorize_ages, returns a Series with category dtype
+    return _category_series(series, categorize_ages(series.to_numpy()), AGE_LABELS)
+
+# Example 4: Using branching in a loop to find prime numbers
+# Trial division is O(n * sqrt(n)), so we use a segmented Sieve of Eratosthenes instead.
+# Only odd numbers are stored (index i stands for low + 2 * i), and each segment is
+# small enough to stay in cache, so memory stays flat no matter how large n gets.
+SEGMENT_SIZE = 1 << 18  # odd numbers per segment
+
+def _base_primes(limit):
+    # Plain odd-only sieve for the odd primes up to limit (used to cross off segments)
+    if limit < 3:
+        return []
+    flags = bytearray([1]) * ((limit - 1) // 2)  # flags[i] stands for 2 * i + 3
+    for i in range(len(flags)):
+        p = 2 * i + 3
+        if p * p > limit:
+            break
+        if flags[i]:
+            start = (p * p - 3) // 2
+            flags[start::p] = bytes(len(range(start, len(flags), p)))
+    return [2 * i + 3 for i, flag in enumerate(flags) if flag]
+
+def _sieve_segment(low, high, base_primes):
+    # Flags for the odd numbers in [low, high), low odd; 1 means prime
+    size = (high - low + 1) // 2
+    if np is not None:
+        flags = np.ones(size, dtype=np.bool_)
+    else:
+        flags = bytearray([1]) * size
+    for p in base_primes:
+        if p * p >= high:
+            break
+        start = max(p * p, (low + p - 1) // p * p)
+        if start % 2 == 0:
+            start += p  # the next multiple is odd
+        index = (start - low) // 2
+        if np is not None:
+            flags[index::p] = False
+        else:
+            flags[index::p] = bytes(len(range(index, size, p)))
+    if low == 1:
+        flags[0] = 0  # 1 is not prime
+    return flags
+
+def _segments(n, segment_size):
+    # Yield (low, high) bounds of odd-aligned segments covering [1, n]
+    span = 2 * segment_size
+    for low in range(1, n + 1, span):
+        yield low, min(low + span, n + 1)
+
+def iter_primes(n, segment_size=SEGMENT_SIZE):
+    # Streaming mode: yield the primes up to n one segment (list) at a time
+    if n < 2:
+        return
+    base_primes = _base_primes(isqrt(n))
+    first = True
+    for low, high in _segments(n, segment_size):
+        flags = _sieve_segment(low, high, base_primes)
+        if np is not None:
+            primes = (np.flatnonzero(flags) * 2 + low).tolist()
+        else:
+            primes = list(compress(range(low, high, 2), flags))
+        if first:
+            primes.insert(0, 2)
+            first = False
+        yield primes
+
+# Parallel mode: worker processes sieve whole segments and write their flags into one
+# shared memory buffer, so only segment bounds (never lists of primes) are pickled
+_shared_flags = None
+_shared_base_primes = None
+
+def _init_sieve_worker(name, base_primes):
+    from multiprocessing import shared_memory
+
+    global _shared_flags, _shared_base_primes
+    _shared_flags = shared_memory.SharedMemory(name=name)
+    _shared_base_primes = base_primes
+
+def _sieve_into_shared(bounds):
+    low, high = bounds
+    flags = _sieve_segment(low, high, _shared_base_primes)
+    offset = (low - 1) // 2
+    if np is not None:
+        target = np.frombuffer(_shared_flags.buf, dtype=np.bool_, count=len(flags), offset=offset)
+        target[:] = flags
+        del target  # release the view on the shared buffer
+    else:
+        _shared_flags.buf[offset:offset + len(flags)] = flags
+
+def _parallel_primes(n, workers, segment_size):
+    # Process pools and shared memory are only imported by the parallel mode
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    base_primes = _base_primes(isqrt(n))
+    size = (n + 1) // 2  # one flag per odd number in [1, n]
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        with ProcessPoolExecutor(workers, initializer=_init_sieve_worker,
+                                 initargs=(shm.name, base_primes)) as pool:
+            bounds = list(_segments(n, segment_size))
+            chunksize = max(1, len(bounds) // (4 * workers))
+            for _ in pool.map(_sieve_into_shared, bounds, chunksize=chunksize):
+                pass
+        shm.buf[0] = 1  # 1 was crossed off, its slot is reused for the even prime below
+        if np is not None:
+            flags = np.frombuffer(shm.buf, dtype=np.bool_, count=size)
+            primes = (np.flatnonzero(flags) * 2 + 1).tolist()
+            del flags
+        else:
+            primes = list(compress(range(1, n + 1, 2), shm.buf[:size]))
+        primes[0] = 2
+        return primes
+    finally:
+        shm.close()
+        shm.unlink()
+
+def find_primes(n, segment_size=SEGMENT_SIZE, workers=None):
+    # workers=None sieves in this process, workers=k spreads the segments over k processes
+    if workers is not None and n >= 2:
+        return _parallel_primes(n, workers, segment_size)
+    primes = []
+    for segment in iter_primes(n, segment_size):
+        primes.extend(segment)
+    return primes
+
+def count_primes(n, segment_size=SEGMENT_SIZE):
+    # Count the primes up to n without ever building the list
+    if n < 2:
+        return 0
+    base_primes = _base_primes(isqrt(n))
+    count = 1  # the even prime 2
+    for low, high in _segments(n, segment_size):
+        flags = _sieve_segment(low, high, base_primes)
+        if np is not None:
+            count += int(np.count_nonzero(flags))
+        else:
+            count += flags.count(1)
+    return count
+
+def benchmark_find_primes(n=10 ** 7, max_workers=None):
+    # Throughput of the parallel sieve as the worker count grows from 1 to max_workers
+    max_workers = max_workers or os.cpu_count()
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        find_primes(n, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"{workers} worker(s): {elapsed:.3f}s, {n / elapsed / 1e6:.1f}M numbers/s")
+
+# Example 5: Using branching to implement a simple calculator
+# The operation name is looked up once in a dispatch table of interned names, instead of
+# being compared against every name in an if/elif chain on each call
+CALCULATOR_OPERATIONS = ("add", "subtract", "multiply", "divide")
+OPERATION_CODES = {sys.intern(name): code for code, name in enumerate(CALCULATOR_OPERATIONS)}
+DIVIDE = OPERATION_CODES["divide"]
+_SCALAR_OPERATIONS = (operator.add, operator.sub, operator.mul, operator.truediv)
+
+def simple_calculator(a, b, operation):
+    code = OPERATION_CODES.get(operation)
+    if code is None:
+        return "Invalid operation"
+    if code == DIVIDE and b == 0:
+        return "Cannot divide by zero"
+    return _SCALAR_OPERATIONS[code](a, b)
+
+def _divide_or_nan(a, b):
+    # Element-wise a / b with NaN wherever b is zero, instead of a warning and inf
+    if np is None:
+        return a / b if b != 0 else float("nan")
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64))
+    out = np.full(a.shape, np.nan)
+    np.divide(a, b, out=out, where=b != 0)
+    return out
+
+def calculate_many(a, b, operations, return_mask=False):
+    # Batch version of simple_calculator. operations holds names or codes from
+    # OPERATION_CODES. Rows are grouped by operation and every group is evaluated with a
+    # single ufunc call. Division by zero gives NaN, and return_mask=True also returns the
+    # boolean mask of those rows.
+    if np is None:
+        results, mask = [], []
+        for x, y, op in zip(a, b, operations):
+            code = OPERATION_CODES[op] if isinstance(op, str) else op
+            by_zero = code == DIVIDE and y == 0
+            results.append(float("nan") if by_zero else _SCALAR_OPERATIONS[code](x, y))
+            mask.append(by_zero)
+        return (results, mask) if return_mask else results
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    operations = np.asarray(operations)
+    if operations.dtype.kind in "USO":
+        names, codes = np.unique(operations, return_inverse=True)
+        unknown = [str(name) for name in names if name not in OPERATION_CODES]
+        if unknown:
+            raise ValueError(f"Invalid operation(s): {unknown}")
+        codes = np.array([OPERATION_CODES[name] for name in names])[codes.reshape(operations.shape)]
+    else:
+        codes = operations
+        if codes.size and (codes.min() < 0 or codes.max() >= len(CALCULATOR_OPERATIONS)):
+            raise ValueError("Invalid operation code")
+    result = np.empty(np.broadcast_shapes(a.shape, b.shape, codes.shape))
+    a, b, codes = np.broadcast_arrays(a, b, codes)
+    ufuncs = (np.add, np.subtract, np.multiply, _divide_or_nan)
+    for code, ufunc in enumerate(ufuncs):
+        rows = codes == code
+        if rows.any():
+            result[rows] = ufunc(a[rows], b[rows])
+    if return_mask:
+        return result, (codes == DIVIDE) & (b == 0)
+    return result
+
+# Arithmetic expressions such as "a*b+c" are parsed once into a tree of ufunc calls, which
+# can then be evaluated over whole columns as many times as needed. The ast module is
+# only imported when the first expression is compiled.
+@lru_cache(maxsize=None)
+def _expression_operators():
+    import ast
+
+    return {
+        ast.Add: operator.add,
+        ast.Sub: operator.sub,
+        ast.Mult: operator.mul,
+        ast.Div: _divide_or_nan,
+        ast.Pow: operator.pow,
+    }
+
+class CompiledExpression:
+    def __init__(self, text):
+        import ast
+
+        self.text = text
+        self.variables = set()
+        self._evaluate = self._compile(ast.parse(text, mode="eval").body)
+
+    def _compile(self, node):
+        import ast
+
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            value = node.value
+            return lambda columns: value
+        if isinstance(node, ast.Name):
+            name = node.id
+            self.variables.add(name)
+            return lambda columns: columns[name]
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            operand = self._compile(node.operand)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+            return lambda columns: -operand(columns)
+        operators = _expression_operators()
+        if isinstance(node, ast.BinOp) and type(node.op) in operators:
+            left = self._compile(node.left)
+            right = self._compile(node.right)
+            func = operators[type(node.op)]
+            return lambda columns: func(left(columns), right(columns))
+        raise ValueError(f"Unsupported syntax in expression {self.text!r}: {ast.dump(node)}")
+
+    def evaluate(self, columns):
+        # columns maps variable names to arrays (a dict or a DataFrame both work)
+        missing = [name for name in self.variables if name not in columns]
+        if missing:
+            raise KeyError(f"Missing column(s) for expression {self.text!r}: {sorted(missing)}")
+        names = sorted(self.variables)
+        if np is None:  # evaluate row by row over plain sequences
+            rows = zip(*(columns[name] for name in names))
+            return [self._evaluate(dict(zip(names, row))) for row in rows]
+        return self._evaluate({name: np.asarray(columns[name]) for name in names})
+
+def compile_expression(text):
+    return CompiledExpression(text)
+
+# Example 6: Using branching to solve the FizzBuzz problem
+def fizz_buzz(n):
+    result = []
+    for i in range(1, n + 1):
+        # Check multiple conditions with elif
+        if i % 3 == 0 and i % 5 == 0:
+            result.append("FizzBuzz")
+        elif i % 3 == 0:
+            result.append("Fizz")
+        elif i % 5 == 0:
+            result.append("Buzz")
+        else:
+            result.append(str(i))
+    return result
+
+# Streaming FizzBuzz: the answers repeat every 15 numbers, so instead of two modulo
+# checks per number we walk the 15-long cycle alongside the numbers
+FIZZ_BUZZ_CYCLE = (None, None, "Fizz", None, "Buzz", "Fizz", None, None,
+                   "Fizz", "Buzz", None, "Fizz", None, None, "FizzBuzz")
+FIZZ_BUZZ_CHUNK = 15 * 4096  # numbers per chunk, a whole number of cycles
+_FIZZ_BUZZ_PERIOD = "%d\n%d\nFizz\n%d\nBuzz\nFizz\n%d\n%d\nFizz\nBuzz\n%d\nFizz\n%d\n%d\nFizzBuzz\n"
+_FIZZ_BUZZ_OFFSETS = (1, 2, 4, 7, 8, 11, 13, 14)  # positions in a cycle that print the number
+
+@lru_cache(maxsize=None)
+def _digit_pairs():
+    # "00".."99" as a (100, 2) table of ASCII digits, built on first use
+    return np.frombuffer("".join(f"{i:02d}" for i in range(100)).encode(), dtype=np.uint8).reshape(100, 2)
+
+def iter_fizz_buzz(n, chunk=FIZZ_BUZZ_CHUNK):
+    # Yield the FizzBuzz answers for 1..n as lists of at most chunk strings
+    chunk = max(15, chunk - chunk % 15)  # keep every chunk aligned to the cycle
+    for start in range(1, n + 1, chunk):
+        stop = min(start + chunk, n + 1)
+        yield [word or str(i) for i, word in zip(range(start, stop), cycle(FIZZ_BUZZ_CYCLE))]
+
+def _fizz_buzz_text(base, periods):
+    # Text for the numbers base+1 .. base+15*periods (base is a multiple of 15)
+    numbers = [b + offset for b in range(base, base + 15 * periods, 15) for offset in _FIZZ_BUZZ_OFFSETS]
+    return (_FIZZ_BUZZ_PERIOD * periods) % tuple(numbers)
+
+def _fizz_buzz_block(base, periods, digits):
+    # Same output as _fizz_buzz_text, for periods whose numbers all have the same digit
+    # count: copy a template row per period and fill in only the digit columns. The last
+    # two digits come from a 100-entry table, the leading ones are computed once per prefix.
+    row = np.frombuffer(_fizz_buzz_text(10 ** (digits - 1) - 1, 1).encode(), dtype=np.uint8)
+    line_starts = np.flatnonzero(np.concatenate(([True], row[:-1] == ord("\n"))))
+    slot_starts = [int(i) for i in line_starts if chr(row[i]).isdigit()]
+    block = np.empty((periods, row.size), dtype=np.uint8)
+    block[:] = row
+    numbers = base + 15 * np.arange(periods, dtype=np.int64)[:, None] + np.array(_FIZZ_BUZZ_OFFSETS)
+    prefixes, last_two = np.divmod(numbers, 100)
+    first = prefixes[0, 0]
+    powers = 10 ** np.arange(digits - 3, -1, -1)
+    prefix_digits = (np.arange(first, prefixes[-1, -1] + 1)[:, None] // powers % 10 + ord("0")).astype(np.uint8)
+    prefix_digits = prefix_digits.take(prefixes - first, axis=0)
+    last_digits = _digit_pairs().take(last_two, axis=0)
+    for slot, start in enumerate(slot_starts):
+        block[:, start:start + digits - 2] = prefix_digits[:, slot]
+        block[:, start + digits - 2:start + digits] = last_digits[:, slot]
+    return block.tobytes()
+
+def write_fizz_buzz(n, fileobj, chunk=FIZZ_BUZZ_CHUNK):
+    # Write the FizzBuzz answers for 1..n, one per line, into a binary file object.
+    # Only one chunk of output is held in memory at a time.
+    periods = max(1, chunk // 15)
+    full = n - n % 15
+    base = 0
+    while base < full:
+        count = min(periods, (full - base) // 15)
+        if np is not None:
+            digits = len(str(base + 1))
+            same_width = (10 ** digits - 15 - base) // 15 + 1  # periods before the width grows
+            if same_width > 0:
+                count = min(count, same_width)
+                fileobj.write(_fizz_buzz_block(base, count, digits))
+                base += 15 * count
+                continue
+            count = 1  # this period crosses a power of ten
+        fileobj.write(_fizz_buzz_text(base, count).encode())
+        base += 15 * count
+    if full < n:
+        tail = [word or str(i) for i, word in zip(range(full + 1, n + 1), FIZZ_BUZZ_CYCLE)]
+        fileobj.write(("\n".join(tail) + "\n").encode())
+
+# Example 7: Using branching for error handling
+def safe_divide(a, b):
+    try:
+        return a / b
+    except ZeroDivisionError:
+        return "Cannot divide by zero"
+
+# Testing the functions
+def main():
+    # The demo output goes through one shared buffer instead of a write per print
+    print = stdout_sink.print
+    print(check_even_odd(4))          # Output: Even
+    print(grade_score(85))            # Output: B
+    print(check_age_category(10))     # Output: Child
+    print(grade_scores([95, 85, 42]))  # Output: [4 3 0], that is A, B, F
+    print(find_primes(20))            # Output: [2, 3, 5, 7, 11, 13, 17, 19]
+    print(count_primes(10 ** 6))      # Output: 78498
+    print(simple_calculator(10, 5, "multiply"))  # Output: 50
+    print(calculate_many([10, 10], [5, 0], ["multiply", "divide"]))  # Output: [50. nan]
+    print(compile_expression("a*b+c").evaluate({"a": [1, 2], "b": [3, 4], "c": [5, 6]}))  # Output: [ 8 14]
+    print(fizz_buzz(15))              # Output: ['1', '2', 'Fizz', '4', 'Buzz', 'Fizz', '7', '8', 'Fizz', 'Buzz', '11', 'Fizz', '13', '14', 'FizzBuzz']
+    print(safe_divide(10, 0))         # Output: Cannot divide by zero
+    print(next(iter_fizz_buzz(100, chunk=15)))  # Output: the same 15 answers as fizz_buzz(15)
+    print(find_primes(20, workers=2))  # Output: [2, 3, 5, 7, 11, 13, 17, 19]
+    stdout_sink.flush()
+
+# Importing this module runs nothing; worker processes import it to find the sieve
+# functions, so the demo (which starts a process pool) only runs as the main script:
+#     python -m bootcamp.branching
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+# Notes:
+# A dictionary is an unordered collection of key-value pairs.
+# Keys must be unique and immutable.
+# Dictionaries are defined using curly braces {}.
+
+import hashlib
+import heapq
+import numbers
+import operator
+from collections import Counter
+from itertools import islice, repeat
+
+from ._lazy import optional_import
+
+np = optional_import("numpy")  # NumPy is optional, the sketch falls back to plain lists
+
+# Algorithm 2: Count the frequency of elements in a list using a dictionary
+def count_frequency(items):
+    frequency = {}
+    for item in items:
+        if item in frequency:
+            frequency[item] += 1
+        else:
+            frequency[item] = 1
+    return frequency
+
+# Algorithm 3: Count frequencies over a stream, in bounded memory if needed
+# FrequencyCounter consumes any iterable chunk by chunk. Exact mode keeps a Counter, whose
+# update() runs in C, and NumPy arrays are counted with np.unique(return_counts=True).
+# Sketch mode (sketch_width=...) replaces the exact dict with a Count-Min Sketch, a
+# depth x width table of counters that never under-counts, plus the top_k heavy hitters.
+# Keys are hashed with blake2b rather than hash(), so sketches built in different
+# processes line up and can be merged.
+class FrequencyCounter:
+    def __init__(self, sketch_width=None, sketch_depth=4, top_k=100, chunk_size=100_000):
+        self.sketch_width = sketch_width
+        self.sketch_depth = sketch_depth
+        self.top_k = top_k
+        self.chunk_size = chunk_size
+        self._sketch_total = 0
+        if sketch_width is None:
+            self.counts = Counter()
+        else:
+            self.counts = None
+            if np is not None:
+                self.table = np.zeros((sketch_depth, sketch_width), dtype=np.int64)
+            else:
+                self.table = [[0] * sketch_width for _ in range(sketch_depth)]
+            self.heavy_hitters = {}  # candidate key -> estimated count, at most top_k entries
+
+    @property
+    def exact(self):
+        return self.counts is not None
+
+    @property
+    def total(self):
+        # Number of items counted so far (a sketch over-counts any key by at most
+        # about e * total / sketch_width, with high probability)
+        if self.exact:
+            return sum(self.counts.values())
+        return self._sketch_total
+
+    def update(self, items):
+        # Count a NumPy array in one call, anything else chunk by chunk
+        if np is not None and isinstance(items, np.ndarray):
+            keys, counts = np.unique(items, return_counts=True)
+            self._add_counts(dict(zip(keys.tolist(), counts.tolist())))
+            return self
+        if self.exact:
+            self.counts.update(items)
+            return self
+        iterator = iter(items)
+        while True:
+            chunk = Counter(islice(iterator, self.chunk_size))
+            if not chunk:
+                return self
+            self._add_counts(chunk)
+
+    def update_chunks(self, chunks):
+        # Count a stream that arrives as separate chunks (lists, arrays, lines of a file...)
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    def _add_counts(self, counts):
+        if self.exact:
+            self.counts.update(counts)
+            return
+        self._sketch_total += sum(counts.values())
+        keys = list(counts)
+        self._add_to_table(self._columns(keys), [counts[key] for key in keys])
+        estimates = self.heavy_hitters
+        estimates.update(zip(keys, self._estimate(keys)))
+        if len(estimates) > self.top_k:
+            self.heavy_hitters = dict(heapq.nlargest(self.top_k, estimates.items(), key=lambda pair: pair[1]))
+
+    def _columns(self, keys):
+        # One column per sketch row for every key, derived from a single 64-bit hash
+        # (double hashing: h1 + row * h2)
+        columns = []
+        for key in keys:
+            key = _normalize_key(key)
+            if isinstance(key, str):
+                data = key.encode()
+            elif isinstance(key, bytes):
+                data = key
+            else:
+                data = repr(key).encode()
+            digest = int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+            h1, h2 = digest & 0xFFFFFFFF, (digest >> 32) | 1
+            columns.append([(h1 + row * h2) % self.sketch_width for row in range(self.sketch_depth)])
+        return columns
+
+    def _add_to_table(self, columns, counts):
+        if np is not None:
+            columns = np.array(columns, dtype=np.int64).reshape(-1, self.sketch_depth)
+            for row in range(self.sketch_depth):
+                np.add.at(self.table[row], columns[:, row], counts)
+        else:
+            for key_columns, count in zip(columns, counts):
+                for row, column in enumerate(key_columns):
+                    self.table[row][column] += count
+
+    def _estimate(self, keys):
+        columns = self._columns(keys)
+        if np is not None:
+            columns = np.array(columns, dtype=np.int64).reshape(-1, self.sketch_depth)
+            rows = np.arange(self.sketch_depth)
+            return self.table[rows, columns].min(axis=1).tolist()
+        return [min(self.table[row][column] for row, column in enumerate(key_columns))
+                for key_columns in columns]
+
+    def __getitem__(self, key):
+        # Exact count, or the sketch estimate (never lower than the true count)
+        if self.exact:
+            return self.counts[key]
+        return self._estimate([key])[0]
+
+    def most_common(self, k=None):
+        if self.exact:
+            return self.counts.most_common(k)
+        ranked = sorted(self.heavy_hitters.items(), key=lambda pair: pair[1], reverse=True)
+        return ranked if k is None else ranked[:k]
+
+    def merge(self, other):
+        # Add the partial counts of another counter, for example one built in a worker process
+        if self.exact != other.exact:
+            raise ValueError("Cannot merge an exact counter with a sketch")
+        if self.exact:
+            self.counts.update(other.counts)
+            return self
+        if (self.sketch_width, self.sketch_depth) != (other.sketch_width, other.sketch_depth):
+            raise ValueError("Cannot merge sketches of different sizes")
+        self._sketch_total += other._sketch_total
+        if np is not None:
+            self.table += other.table
+        else:
+            for row, other_row in zip(self.table, other.table):
+                for column, count in enumerate(other_row):
+                    row[column] += count
+        keys = list(set(self.heavy_hitters) | set(other.heavy_hitters))
+        estimates = zip(keys, self._estimate(keys))
+        self.heavy_hitters = dict(heapq.nlargest(self.top_k, estimates, key=lambda pair: pair[1]))
+        return self
+
+def _normalize_key(key):
+    # Keys that compare equal must land in the same cells: NumPy scalars become Python
+    # ones, and integral numbers (5, np.int64(5), 5.0, True for 1) the same int
+    if np is not None and isinstance(key, np.generic):
+        key = key.item()
+    if isinstance(key, numbers.Integral):
+        return operator.index(key)
+    if isinstance(key, float) and key.is_integer():
+        return int(key)
+    return key
+
+def _count_chunk(chunk, options):
+    return FrequencyCounter(**options).update(chunk)
+
+def count_frequency_parallel(chunks, workers=None, **options):
+    # Count every chunk in a worker process and merge the partial results
+    from concurrent.futures import ProcessPoolExecutor
+
+    result = FrequencyCounter(**options)
+    with ProcessPoolExecutor(workers) as pool:
+        for partial in pool.map(_count_chunk, chunks, repeat(options)):
+            result.merge(partial)
+    return result
+
+def main():
+    # Common Operations:
+    # Creating a dictionary
+    my_dict = {"key1": "value1", "key2": "value2"}
+
+    # Accessing values
+    print(my_dict["key1"])  # Output: value1
+
+    # Adding or updating a key-value pair
+    my_dict["key3"] = "value3"
+    print(my_dict)  # Output: {'key1': 'value1', 'key2': 'value2', 'key3': 'value3'}
+
+    # Removing a key-value pair
+    del my_dict["key1"]
+    print(my_dict)  # Output: {'key2': 'value2', 'key3': 'value3'}
+
+    # Iterating through keys and values
+    for key, value in my_dict.items():
+        print(f"{key}: {value}")
+    # Output:
+    # key2: value2
+    # key3: value3
+
+    # Example usage
+    items = ["apple", "banana", "apple", "cherry", "banana", "banana"]
+    print(count_frequency(items))
+    # Output: {'apple': 2, 'banana': 3, 'cherry': 1}
+
+    counter = FrequencyCounter().update_chunks([["apple", "banana"], ["apple", "cherry", "banana", "banana"]])
+    print(counter.most_common(2))  # Output: [('banana', 3), ('apple', 2)]
+
+    sketch = FrequencyCounter(sketch_width=1024, top_k=2).update(items)
+    print(sketch.most_common())  # Output: [('banana', 3), ('apple', 2)]
+
+    print(count_frequency_parallel([items, items], workers=2).most_common(1))  # Output: [('banana', 6)]
+
+# Worker processes re-import this module on some platforms, so the pool only runs here
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+import threading
+import time
+from array import array
+from collections import Counter
+
+from ._lazy import optional_import
+from .input_providers import get_input_provider
+
+np = optional_import("numpy")  # NumPy is optional, Inventory falls back to array.array
+
+# Raising exceptions
+INVALID_DIMENSIONS = "Invalid dimensions provided. Length and width must be positive values."
+
+def calculate_area(length, width):
+    # not (x > 0) rather than x <= 0, so NaN is invalid too, as in the vectorized checks
+    if not (length > 0 and width > 0):
+        raise ValueError(INVALID_DIMENSIONS)
+    return length * width
+
+# Raising and catching costs microseconds per failure, which adds up in tight loops where
+# 5-10% of the rows are bad. The variants below return the outcome instead of raising.
+# ValidationStats counts the failures so a pipeline can report its failure rate.
+class ValidationStats:
+    def __init__(self):
+        self.started = time.monotonic()
+        self.checked = 0
+        self.failures = Counter()  # reason -> count
+        self.lock = threading.Lock()
+
+    def record(self, checked, failures=None):
+        with self.lock:
+            self.checked += checked
+            if failures:
+                self.failures.update({reason: count for reason, count in failures.items() if count})
+
+    @property
+    def failed(self):
+        return sum(self.failures.values())
+
+    def failures_per_second(self):
+        elapsed = time.monotonic() - self.started
+        return self.failed / elapsed if elapsed > 0 else 0.0
+
+    def report(self):
+        reasons = ", ".join(f"{reason}: {count}" for reason, count in self.failures.most_common())
+        return (f"{self.failed}/{self.checked} rows failed validation "
+                f"({self.failures_per_second():.1f}/s){': ' + reasons if reasons else ''}")
+
+def try_calculate_area(length, width):
+    # (True, area) or (False, error message), never raises
+    if not (length > 0 and width > 0):
+        return False, INVALID_DIMENSIONS
+    return True, length * width
+
+def validate_dimensions(lengths, widths, stats=None):
+    # Check every row in one pass and return all the errors as (row, message) pairs
+    if np is not None:
+        bad = np.flatnonzero(~((np.asarray(lengths) > 0) & (np.asarray(widths) > 0))).tolist()
+        checked = len(lengths)
+    else:
+        bad = [row for row, (length, width) in enumerate(zip(lengths, widths))
+               if not (length > 0 and width > 0)]
+        checked = min(len(lengths), len(widths))
+    if stats is not None:
+        stats.record(checked, {"invalid dimensions": len(bad)})
+    return [(row, INVALID_DIMENSIONS) for row in bad]
+
+def calculate_areas(lengths, widths, stats=None):
+    # Vectorized calculate_area: a masked array where invalid rows are masked (a list with
+    # None for invalid rows without NumPy)
+    if np is None:
+        results = [try_calculate_area(length, width) for length, width in zip(lengths, widths)]
+        if stats is not None:
+            stats.record(len(results), {"invalid dimensions": sum(not ok for ok, _ in results)})
+        return [value if ok else None for ok, value in results]
+    lengths = np.asarray(lengths)
+    widths = np.asarray(widths)
+    invalid = ~((lengths > 0) & (widths > 0))
+    if stats is not None:
+        stats.record(invalid.size, {"invalid dimensions": int(invalid.sum())})
+    return np.ma.masked_array(lengths * widths, mask=invalid)
+
+# Custom exceptions
+class OutOfStockError(Exception):
+    pass
+
+class Item:
+    def __init__(self, name, quantity):
+        self.name = name
+        self.quantity = quantity
+    
+    def reduce_stock(self, amount):
+        if amount > self.quantity:
+            raise OutOfStockError(f"Error: Not enough {self.name} in stock.")
+        self.quantity -= amount
+
+    def try_reduce_stock(self, amount):
+        # (True, remaining quantity) or (False, error message), never raises
+        if amount > self.quantity:
+            return False, f"Error: Not enough {self.name} in stock."
+        self.quantity -= amount
+        return True, self.quantity
+
+# A catalogue of millions of SKUs: one Item object (and one __dict__) per SKU costs
+# hundreds of bytes each. Inventory keeps every quantity in one int64 array instead, and
+# hands out small __slots__ objects when a single SKU is needed.
+class InventoryItem:
+    __slots__ = ("inventory", "row")
+
+    def __init__(self, inventory, row):
+        self.inventory = inventory
+        self.row = row
+
+    @property
+    def name(self):
+        return self.inventory.names[self.row]
+
+    @property
+    def quantity(self):
+        return int(self.inventory.quantities[self.row])
+
+    def reduce_stock(self, amount):
+        self.inventory.reduce_stock(self.name, amount)
+
+class Inventory:
+    def __init__(self, names, quantities, stripes=64):
+        self.names = list(names)
+        self.rows = {name: row for row, name in enumerate(self.names)}
+        if np is not None:
+            self.quantities = np.array(quantities, dtype=np.int64)
+        else:
+            self.quantities = array("q", quantities)
+        # Striped locks: the lock for a row is locks[row % stripes], so threads working on
+        # different SKUs rarely wait for each other
+        self.locks = [threading.Lock() for _ in range(stripes)]
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, name):
+        return InventoryItem(self, self.rows[name])
+
+    def _lock(self, row):
+        return self.locks[row % len(self.locks)]
+
+    def reduce_stock(self, name, amount):
+        row = self.rows[name]
+        with self._lock(row):
+            if amount > self.quantities[row]:
+                raise OutOfStockError(f"Error: Not enough {name} in stock.")
+            self.quantities[row] -= amount
+
+    def reserve(self, name, amount):
+        # Thread-safe reduce_stock that returns False instead of raising
+        row = self.rows[name]
+        with self._lock(row):
+            if amount < 0 or amount > self.quantities[row]:
+                return False
+            self.quantities[row] -= amount
+            return True
+
+    def release(self, name, amount):
+        # Give back stock taken by reserve()
+        row = self.rows[name]
+        with self._lock(row):
+            self.quantities[row] += amount
+
+    def reduce_stock_many(self, names, amounts, stats=None):
+        # Apply a whole batch and return a mask of the rows that failed, instead of raising
+        # once per row. Rows for the same SKU are served in batch order, like reserve()
+        # calls one after the other: a row fails if the stock left by the earlier accepted
+        # rows for that SKU cannot cover it. Unknown names, negative amounts and amounts
+        # that are not whole numbers fail too. Failures are counted in stats if given.
+        failed = self._reduce_stock_many(names, amounts)
+        if stats is not None:
+            stats.record(len(failed), {"stock request rejected": int(sum(failed))})
+        return failed
+
+    def _reduce_stock_many(self, names, amounts):
+        rows = [self.rows.get(name, -1) for name in names]
+        stripes = sorted({row % len(self.locks) for row in rows if row >= 0})
+        for stripe in stripes:  # always in the same order, so batches cannot deadlock
+            self.locks[stripe].acquire()
+        try:
+            if np is not None:
+                return self._reduce_many_vectorized(np.array(rows, dtype=np.int64), _whole_amounts(amounts))
+            failed = []
+            remaining = {}
+            for row, amount in zip(rows, amounts):
+                if (row < 0 or amount < 0 or amount % 1
+                        or amount > remaining.get(row, self.quantities[row])):
+                    failed.append(True)
+                    continue
+                remaining[row] = remaining.get(row, self.quantities[row]) - amount
+                failed.append(False)
+            for row, amount, bad in zip(rows, amounts, failed):
+                if not bad:
+                    self.quantities[row] -= int(amount)
+            return failed
+        finally:
+            for stripe in stripes:
+                self.locks[stripe].release()
+
+    def _reduce_many_vectorized(self, rows, amounts):
+        valid = (rows >= 0) & (amounts >= 0)
+        # Running demand per SKU in batch order: sort by row (stable), cumulative sum, and
+        # subtract the total of the rows before each SKU's group
+        order = np.argsort(rows, kind="stable")
+        sorted_rows = rows[order]
+        running = np.cumsum(np.where(valid, amounts, 0)[order])
+        group_start = np.flatnonzero(np.r_[True, sorted_rows[1:] != sorted_rows[:-1]])
+        before_group = np.r_[0, running][group_start]
+        group_sizes = np.diff(np.r_[group_start, rows.size])
+        running -= np.repeat(before_group, group_sizes)
+        ok = np.empty(rows.size, dtype=bool)
+        ok[order] = running <= self.quantities[np.maximum(sorted_rows, 0)]
+        ok &= valid
+        # In a SKU whose demand overflows, a rejected row must not use up stock for the rows
+        # after it, so those few groups are served again one row at a time
+        overflowing = np.unique(rows[valid & ~ok])
+        if overflowing.size:
+            replay = np.isin(rows, overflowing)
+            ok[replay] = False
+            remaining = dict(zip(overflowing.tolist(), self.quantities[overflowing].tolist()))
+            for index in np.flatnonzero(replay & valid).tolist():
+                row, amount = int(rows[index]), int(amounts[index])
+                if amount <= remaining[row]:
+                    remaining[row] -= amount
+                    ok[index] = True
+        np.subtract.at(self.quantities, rows[ok], amounts[ok])
+        return ~ok
+
+def _whole_amounts(amounts):
+    # amounts as int64, with -1 (a failing row) for any amount that is not a whole number,
+    # which a plain cast to int64 would silently cut down (1.5 -> 1)
+    amounts = np.asarray(amounts)
+    if amounts.dtype.kind in "iu":
+        return amounts.astype(np.int64, copy=False)
+    amounts = amounts.astype(np.float64)
+    whole = np.isfinite(amounts) & (amounts == np.floor(amounts))
+    return np.where(whole, amounts, -1).astype(np.int64)
+
+def main():
+    # try-except
+    try:
+        num_list = [1, 2, 3]
+        print(num_list[5])
+    except IndexError:
+        print("Oops! Index out of range. Ensure you're accessing a valid index within the list.")
+
+    # Handling multiple exceptions 
+    inputs = get_input_provider()
+    try:
+        user_input = inputs.read_line("Please enter an integer: ", default="")
+        result = int(user_input)
+    except ValueError:
+        print("Error: Input must be a valid integer. Please try again.")
+
+    # Raising exceptions
+    try:
+        area = calculate_area(-5, 4)
+    except ValueError as e:
+        print("Error:", e)
+
+    stats = ValidationStats()
+    print(try_calculate_area(-5, 4))  # Output: (False, 'Invalid dimensions provided. ...')
+    print(calculate_areas([5, -5, 2], [4, 4, 0], stats))  # Output: [20 -- --]
+    print(stats.report())  # Output: 2/3 rows failed validation (.../s): invalid dimensions: 2
+
+    # Custom exceptions
+    item = Item("Apples", 5)
+    try:
+        item.reduce_stock(10)
+    except OutOfStockError as e:
+        print("Error:", e)
+
+    inventory = Inventory(["Apples", "Pears"], [5, 3])
+    print(inventory.reduce_stock_many(["Apples", "Pears", "Apples", "Plums"], [4, 1, 2, 1]))
+    # Output: [False False  True  True] (the second Apples order and the unknown SKU fail)
+    print(inventory["Apples"].quantity)  # Output: 1
+
+    # Using finally
+    try:
+        file = open("nonexistent_file.txt", "r")
+        content = file.read()
+    except FileNotFoundError:
+        print("Error: File not found. Please ensure the file exists.")
+    finally:
+        print("Cleanup: Closing file if it was opened.")
+
+# The examples read from stdin, so they only run as the main script
+if __name__ == "__main__":
+    main()
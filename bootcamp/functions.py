@@ -0,0 +1,544 @@
+# Functions in Python
+
+import math
+import time
+from functools import lru_cache
+from itertools import islice
+
+from ._lazy import optional_import
+
+np = optional_import("numpy")  # NumPy is optional, the batch helpers fall back to plain Python
+
+# 1. Syntax of a Function
+def say_hello(name):
+    """This function prints a hello message."""
+    print("Hello", name + "!")
+
+# 2. Parameters in Functions
+def multiply(x, y):
+    """This function returns the product of two numbers."""
+    return x * y
+
+# 3. Return Statement
+def cube(n):
+    """This function returns the cube of a number."""
+    return n ** 3
+
+# 4. Default Parameters
+def greet(name, greeting="Hello"):
+    """This function prints a greeting message."""
+    print(greeting, name + "!")
+
+# 5. Variable-Length Arguments
+def sum_numbers(*args):
+    """This function returns the sum of all arguments."""
+    return sum(args)
+
+# *args copies every value into a new tuple, so large or streaming inputs go through
+# sum_iter instead, which takes the iterable itself
+def sum_iter(iterable, mode="fast"):
+    """This function sums an iterable: "fast", "fsum" (correctly rounded) or "kahan"."""
+    if mode == "fsum":
+        return math.fsum(iterable)
+    if mode == "kahan":
+        return _kahan_sum(iterable)
+    if mode != "fast":
+        raise ValueError(f"Unknown mode {mode!r}, expected 'fast', 'fsum' or 'kahan'")
+    if np is not None and isinstance(iterable, np.ndarray):
+        # One C loop, and NumPy sums floats pairwise so the error grows only like log(n)
+        return np.add.reduce(iterable, axis=None)
+    return sum(iterable)
+
+def _kahan_sum(iterable):
+    """This function adds floats while carrying the rounding error of every step (Neumaier)."""
+    total = 0.0
+    compensation = 0.0
+    for value in iterable:
+        t = total + value
+        if abs(total) >= abs(value):
+            compensation += (total - t) + value
+        else:
+            compensation += (value - t) + total
+        total = t
+    return total + compensation
+
+def _pairwise_sum(partials):
+    """This function adds partial sums as a balanced tree instead of left to right."""
+    while len(partials) > 1:
+        pairs = [partials[i] + partials[i + 1] for i in range(0, len(partials) - 1, 2)]
+        if len(partials) % 2:
+            pairs.append(partials[-1])
+        partials = pairs
+    return partials[0] if partials else 0
+
+def sum_parallel(values, workers=None, chunk_size=1 << 20):
+    """This function sums a very long input chunk by chunk on a thread pool."""
+    # NumPy releases the GIL inside np.add.reduce, so the chunks of an array are summed in
+    # parallel. An iterator (a generator, a file...) is read chunk_size items at a time
+    # instead, so memory stays bounded; reading it holds the GIL, so it runs in this thread.
+    from concurrent.futures import ThreadPoolExecutor
+
+    if np is None or not isinstance(values, (np.ndarray, list, tuple, range)):
+        iterator = iter(values)
+        chunks = iter(lambda: list(islice(iterator, chunk_size)), [])
+        return _pairwise_sum([_sum_chunk(chunk) for chunk in chunks])
+    array = values if isinstance(values, np.ndarray) else _exact_sum_array(values)
+    if array is None:  # Python ints beyond what int64 can sum, or mixed types
+        chunks = (values[start:start + chunk_size] for start in range(0, len(values), chunk_size))
+        return _pairwise_sum([sum(chunk) for chunk in chunks])
+    array = array.ravel()
+    chunks = [array[start:start + chunk_size] for start in range(0, array.size, chunk_size)]
+    with ThreadPoolExecutor(workers) as pool:
+        partials = list(pool.map(np.add.reduce, chunks))
+    total = _pairwise_sum(partials)
+    return total if isinstance(values, np.ndarray) or array.dtype.kind == "f" else int(total)
+
+def _exact_sum_array(values):
+    """This function converts Python numbers to an array NumPy sums exactly, or returns None."""
+    kinds = {type(value) for value in values}
+    if kinds == {float}:
+        return np.asarray(values, dtype=np.float64)
+    if kinds == {int}:
+        array = np.asarray(values)
+        # int64 sums wrap around silently, so the whole sum must stay inside the range
+        if array.dtype.kind in "iu" and _max_abs(array) * array.size < 1 << 63:
+            return array
+    return None
+
+def _sum_chunk(chunk):
+    """This function sums one chunk of an iterator, in NumPy when that is exact."""
+    array = _exact_sum_array(chunk) if np is not None and chunk else None
+    if array is None:
+        return sum(chunk)
+    total = np.add.reduce(array)
+    return float(total) if array.dtype.kind == "f" else int(total)
+
+def print_info(**kwargs):
+    """This function prints key-value pairs."""
+    for key, value in kwargs.items():
+        print(f"{key}: {value}")
+
+# 6. Lambda Functions
+# Lambda function to subtract two numbers
+subtract = lambda a, b: a - b
+
+# Lazy pipelines: Pipeline(numbers).map(...).filter(...).collect()
+# Nothing runs until collect(). A stage is run on the whole NumPy array in one go when its
+# bytecode shows it only applies arithmetic, comparison and bitwise operators to its
+# argument, constants and int/float variables; the function is never called on a
+# placeholder. The array operators are checked so that the result is exactly what Python
+# gives: integers stay far from int64 overflow, and division by zero, float overflow or an
+# invalid operation make the stage fall back. From a stage that is not vectorized on, every item goes
+# through all remaining stages in a single loop, without intermediate lists.
+_VECTOR_OPERATORS = {
+    "+": "add", "-": "subtract", "*": "multiply", "/": "true_divide", "//": "floor_divide",
+    "%": "remainder", "**": "power", "&": "bitwise_and", "|": "bitwise_or", "^": "bitwise_xor",
+    "<": "less", "<=": "less_equal", ">": "greater", ">=": "greater_equal", "==": "equal", "!=": "not_equal",
+}
+_LEGACY_BINARY_OPS = {  # Python 3.10 and older have one opcode per operator
+    "BINARY_ADD", "BINARY_SUBTRACT", "BINARY_MULTIPLY", "BINARY_TRUE_DIVIDE", "BINARY_FLOOR_DIVIDE",
+    "BINARY_MODULO", "BINARY_POWER", "BINARY_AND", "BINARY_OR", "BINARY_XOR",
+}
+_COMPARISONS = ("<", "<=", ">", ">=", "==", "!=")
+_EXACT_INT = 1 << 62  # bound on every intermediate integer, well inside int64
+_EXACT_FLOAT_INT = 1 << 53  # integers up to here convert to float64 without rounding
+_NUMBER_TYPES = (int, float, bool)
+
+@lru_cache(maxsize=256)
+def _vector_names(code):
+    """This function returns the variables a stage reads if it only applies operators, else None."""
+    import dis
+
+    if code.co_argcount != 1 or code.co_nlocals != 1 or code.co_kwonlyargcount:
+        return None
+    names = set()
+    for instruction in dis.get_instructions(code):
+        op, value = instruction.opname, instruction.argval
+        if op in ("RESUME", "NOP", "CACHE", "COPY_FREE_VARS", "RETURN_VALUE",
+                  "UNARY_NEGATIVE", "UNARY_POSITIVE", "UNARY_INVERT"):
+            continue
+        if op.startswith("LOAD_FAST"):
+            continue  # the argument itself, the only local
+        if op in ("LOAD_CONST", "RETURN_CONST", "LOAD_SMALL_INT") and type(value) in _NUMBER_TYPES:
+            continue
+        if op in ("LOAD_GLOBAL", "LOAD_NAME", "LOAD_DEREF"):
+            names.add(value)
+            continue
+        if op == "BINARY_OP" and instruction.argrepr in _VECTOR_OPERATORS:
+            continue
+        if op == "COMPARE_OP" and value in _VECTOR_OPERATORS:
+            continue
+        if op in _LEGACY_BINARY_OPS:
+            continue
+        return None  # a call, an attribute, a branch, a string...
+    return frozenset(names)
+
+def _is_vectorizable(func):
+    """This function checks whether func can run on a whole array instead of item by item."""
+    code = getattr(func, "__code__", None)
+    names = _vector_names(code) if code is not None else None
+    if names is None:
+        return False
+    for name in names:
+        if name in code.co_freevars:
+            try:
+                value = func.__closure__[code.co_freevars.index(name)].cell_contents
+            except ValueError:  # a closure variable that is not assigned yet
+                return False
+        else:
+            value = func.__globals__.get(name)
+        if type(value) not in _NUMBER_TYPES:
+            return False
+    return True
+
+def _max_abs(value):
+    """This function returns the largest magnitude in an integer array or of an int."""
+    if isinstance(value, np.ndarray):
+        return max(-int(value.min()), int(value.max())) if value.size else 0
+    return abs(value)
+
+class _Inexact(ArithmeticError):
+    """This class signals an array operation whose result could differ from Python's."""
+
+class _Exact:
+    """This class wraps an array so that its operators give exactly Python's results or raise."""
+    __slots__ = ("array",)
+
+    def __init__(self, array):
+        self.array = array
+
+    def _apply(self, symbol, left, right):
+        left = left.array if isinstance(left, _Exact) else left
+        right = right.array if isinstance(right, _Exact) else right
+        if symbol not in ("&", "|", "^") or not (_is_bool(left) and _is_bool(right)):
+            left, right = _as_number(left), _as_number(right)  # True + True is 2, as in Python
+        left_int, right_int = _is_int(left), _is_int(right)
+        if left_int and right_int:
+            # int64 wraps around silently, so the operands' magnitudes must rule it out
+            big_left, big_right = _max_abs(left), _max_abs(right)
+            if (symbol in ("+", "-") and big_left + big_right >= _EXACT_INT
+                    or symbol == "*" and big_left * big_right >= _EXACT_INT
+                    or symbol == "/" and max(big_left, big_right) > _EXACT_FLOAT_INT):
+                raise _Inexact(symbol)
+            if symbol == "**" and big_right and (np.min(right) < 0 or big_left > 1
+                                                 and big_right * big_left.bit_length() >= 62):
+                raise _Inexact(symbol)  # a float result in Python, or too large
+        elif (left_int or right_int) and (symbol == "/" or symbol in _COMPARISONS):
+            # Python compares ints with floats exactly, NumPy converts the int to a float
+            if _max_abs(left if left_int else right) > _EXACT_FLOAT_INT:
+                raise _Inexact(symbol)
+        return _Exact(_checked_result(getattr(np, _VECTOR_OPERATORS[symbol])(left, right)))
+
+    def _unary(self, ufunc):
+        return _Exact(_checked_result(ufunc(_as_number(self.array))))
+
+    def __neg__(self):
+        return self._unary(np.negative)
+
+    def __pos__(self):
+        return self._unary(np.positive)
+
+    def __invert__(self):
+        return self._unary(np.invert)
+
+    def __bool__(self):
+        raise _Inexact("truth value")
+
+def _exact_operator(symbol, reflected=False):
+    """This function builds one operator method of _Exact."""
+    if reflected:
+        return lambda self, other: self._apply(symbol, other, self)
+    return lambda self, other: self._apply(symbol, self, other)
+
+for _method, _symbol in (("add", "+"), ("sub", "-"), ("mul", "*"), ("truediv", "/"), ("floordiv", "//"),
+                         ("mod", "%"), ("pow", "**"), ("and", "&"), ("or", "|"), ("xor", "^")):
+    setattr(_Exact, f"__{_method}__", _exact_operator(_symbol))
+    setattr(_Exact, f"__r{_method}__", _exact_operator(_symbol, reflected=True))
+for _method, _symbol in (("lt", "<"), ("le", "<="), ("gt", ">"), ("ge", ">="), ("eq", "=="), ("ne", "!=")):
+    setattr(_Exact, f"__{_method}__", _exact_operator(_symbol))
+_Exact.__hash__ = None
+
+def _is_bool(value):
+    return value.dtype.kind == "b" if isinstance(value, np.ndarray) else isinstance(value, bool)
+
+def _is_int(value):
+    return value.dtype.kind in "iu" if isinstance(value, np.ndarray) else isinstance(value, int)
+
+def _as_number(value):
+    if isinstance(value, np.ndarray):
+        return value.astype(np.int64) if value.dtype.kind == "b" else value
+    return int(value) if isinstance(value, bool) else value
+
+def _checked_result(array):
+    """This function rejects results that left the range where int64 matches Python ints."""
+    if array.dtype.kind in "iu" and _max_abs(array) >= _EXACT_INT:
+        raise _Inexact("integer overflow")
+    return array
+
+def _apply_exactly(func, array):
+    """This function runs func on a whole array, or returns None where Python would differ."""
+    try:
+        with np.errstate(all="raise", under="ignore"):
+            result = func(_Exact(array))
+    except (ArithmeticError, ValueError, TypeError):
+        return None  # the item loop gives Python's result, or raises Python's error
+    result = result.array if isinstance(result, _Exact) else np.asarray(result)
+    if result.dtype.kind not in "iufb" or result.dtype.kind in "iu" and _max_abs(result) >= _EXACT_INT:
+        return None
+    return np.broadcast_to(result, array.shape)
+
+class Pipeline:
+    """This class chains map and filter stages lazily and runs them in one pass."""
+    # map() and filter() return a new Pipeline, so a shared base can be extended in
+    # different ways without the branches seeing each other's stages
+    def __init__(self, items, stages=()):
+        self.items = items
+        self.stages = list(stages)  # ("map" | "filter", function)
+
+    def map(self, func):
+        return Pipeline(self.items, self.stages + [("map", func)])
+
+    def filter(self, predicate):
+        return Pipeline(self.items, self.stages + [("filter", predicate)])
+
+    def _numeric_array(self):
+        items = self.items
+        if np is None:
+            return None
+        if isinstance(items, np.ndarray):
+            array = items
+        elif isinstance(items, range):
+            array = np.asarray(items) if max(abs(items.start), abs(items.stop)) < _EXACT_INT else None
+        elif isinstance(items, (list, tuple)) and items:
+            # Only lists of a single number type: [1, 2.5] as float64 would turn 1 // 1 into 1.0
+            kinds = {type(item) for item in items}
+            array = np.asarray(items) if len(kinds) == 1 and kinds <= set(_NUMBER_TYPES) else None
+            if array is not None and array.dtype.kind != {int: "i", float: "f", bool: "b"}[kinds.pop()]:
+                return None  # ints beyond int64
+        else:
+            return None
+        if array is None or array.dtype.kind not in "iufb":
+            return None
+        if array.dtype.kind in "iu":
+            if array.size and _max_abs(array) >= _EXACT_INT:
+                return None
+            array = array.astype(np.int64, copy=False)
+        return array
+
+    def _run(self):
+        stages = self.stages
+        items = self.items
+        array = self._numeric_array() if stages and _is_vectorizable(stages[0][1]) else None
+        if array is not None:
+            done = 0
+            for kind, func in stages:
+                result = _apply_exactly(func, array) if _is_vectorizable(func) else None
+                if result is None:
+                    break
+                array = result if kind == "map" else array[result.astype(bool)]
+                done += 1
+            stages = stages[done:]
+            if not stages:
+                return array
+            if done:
+                items = _array_items(array)
+        return _fused_loop(items, stages)
+
+    def __iter__(self):
+        result = self._run()
+        return iter(result.tolist()) if np is not None and isinstance(result, np.ndarray) else result
+
+    def collect(self):
+        """This function runs the pipeline and returns the results as a list."""
+        result = self._run()
+        if np is not None and isinstance(result, np.ndarray):
+            return result.tolist()
+        return list(result)
+
+def _array_items(array, chunk_size=1 << 16):
+    """This function yields the items of an array as Python numbers, a chunk at a time."""
+    # tolist() per chunk is as fast as one tolist() of the whole array, but the loop
+    # starts at once and never holds more than a chunk of Python objects
+    for start in range(0, len(array), chunk_size):
+        yield from array[start:start + chunk_size].tolist()
+
+def _fused_loop(items, stages):
+    """This function pushes every item through all the stages before taking the next one."""
+    for item in items:
+        for kind, func in stages:
+            if kind == "map":
+                item = func(item)
+            elif not func(item):
+                break
+        else:
+            yield item
+
+# 7. Function Annotations
+def add_numbers(a: int, b: int) -> int:
+    """This function adds two numbers."""
+    return a + b
+
+# 8. Recursion
+# Plain double recursion is exponential, so fibonacci() picks one of these strategies by n
+MEMO_MAX_N = 90  # F(90) is the last value the memo path reaches without deep recursion
+INT64_MAX_N = 92  # F(92) is the largest Fibonacci number that fits in an int64
+
+@lru_cache(maxsize=MEMO_MAX_N + 1)
+def fibonacci_memo(n):
+    """This function returns the nth Fibonacci number using bounded LRU memoization."""
+    if n > MEMO_MAX_N:
+        raise ValueError(f"fibonacci_memo only supports n <= {MEMO_MAX_N}, got {n}")
+    if n <= 1:
+        return n
+    return fibonacci_memo(n - 1) + fibonacci_memo(n - 2)
+
+def fibonacci_iterative(n):
+    """This function returns the nth Fibonacci number in O(n) additions."""
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+def fibonacci_fast_doubling(n):
+    """This function returns the nth Fibonacci number in O(log n) big-integer multiplications."""
+    # F(2k) = F(k) * (2F(k+1) - F(k)) and F(2k+1) = F(k)^2 + F(k+1)^2
+    a, b = 0, 1  # F(k), F(k+1) for k = the bits of n read so far
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a
+
+def fibonacci(n):
+    """This function returns the nth Fibonacci number."""
+    if n < 0:
+        raise ValueError(f"n must be non-negative, got {n}")
+    if n <= MEMO_MAX_N:
+        return fibonacci_memo(n)
+    return fibonacci_fast_doubling(n)
+
+# Small Fibonacci numbers are read from one shared int64 table
+_FIB_TABLE = [fibonacci_iterative(k) for k in range(INT64_MAX_N + 1)]
+
+@lru_cache(maxsize=None)
+def _fib_array():
+    """This function returns _FIB_TABLE as a read-only int64 array, built on first use."""
+    # Built here rather than at import, which would import NumPy with the module
+    table = np.array(_FIB_TABLE, dtype=np.int64)
+    table.flags.writeable = False
+    return table
+
+def fibonacci_many(ns):
+    """This function returns the Fibonacci numbers for a whole batch of n values."""
+    if np is not None:
+        ns = np.asarray(ns, dtype=np.int64)
+        if ns.size and ns.min() < 0:
+            raise ValueError("n must be non-negative")
+        if ns.size == 0 or ns.max() <= INT64_MAX_N:
+            return _fib_array()[ns]
+        values = _fibonacci_walk(ns.ravel().tolist())
+        return np.array([values[k] for k in ns.ravel().tolist()], dtype=object).reshape(ns.shape)
+    ns = list(ns)
+    if ns and min(ns) < 0:
+        raise ValueError("n must be non-negative")
+    if not ns or max(ns) <= INT64_MAX_N:
+        return [_FIB_TABLE[k] for k in ns]
+    values = _fibonacci_walk(ns)
+    return [values[k] for k in ns]
+
+def _fibonacci_walk(ns):
+    """This function answers every requested n with a single pass up to max(ns)."""
+    wanted = set(ns)
+    values = {}
+    a, b = 0, 1
+    for k in range(max(wanted) + 1):
+        if k in wanted:
+            values[k] = a
+        a, b = b, a + b
+    return values
+
+def benchmark_fibonacci(max_n=10 ** 6):
+    """This function times every Fibonacci strategy from n=10 up to max_n (about 20 seconds)."""
+    strategies = [
+        ("memo", fibonacci_memo, MEMO_MAX_N),
+        ("iterative", fibonacci_iterative, max_n),
+        ("fast doubling", fibonacci_fast_doubling, max_n),
+    ]
+    n = 10
+    while n <= max_n:
+        for name, func, limit in strategies:
+            if n > limit:
+                continue
+            fibonacci_memo.cache_clear()
+            start = time.perf_counter()
+            func(n)
+            elapsed = time.perf_counter() - start
+            print(f"n={n:>8} {name:<14} {elapsed * 1e3:10.3f} ms")
+        n *= 10
+    batch = list(range(0, 10 ** 4, 7))
+    start = time.perf_counter()
+    fibonacci_many(batch)
+    print(f"fibonacci_many, {len(batch)} values up to n={max(batch)}: "
+          f"{(time.perf_counter() - start) * 1e3:.3f} ms")
+
+# 9. Scope of Variables
+def bar():
+    """This function demonstrates local scope."""
+    y = 15
+    print("Inside function:", y)
+
+# Calling the functions
+def main():
+    """This function runs the examples above."""
+    # Function call
+    say_hello("John")
+
+    # Positional arguments
+    result = multiply(4, 5)
+    print(result)
+
+    # Keyword arguments
+    result = multiply(x=4, y=5)
+    print(result)
+
+    # Function call
+    result = cube(3)
+    print(result)
+
+    # Calling with both arguments
+    greet("Emma", "Hi")
+
+    # Calling with only the required argument
+    greet("Emma")
+
+    print(sum_numbers(1, 2, 3, 4, 5))  # Output: 15
+    print(sum_iter(range(1, 6)))  # Output: 15
+    print(sum_iter([0.1] * 10, mode="kahan"))  # Output: 1.0
+
+    print_info(firstname="John", lastname="Doe", age=30)
+
+    # Calling the lambda function
+    print(subtract(10, 4))  # Output: 6
+
+    # Lambda function for mapping
+    numbers = [1, 2, 3, 4]
+    squared_numbers = list(map(lambda x: x ** 2, numbers))
+    print(squared_numbers)  # Output: [1, 4, 9, 16]
+    print(Pipeline(numbers).map(lambda x: x ** 2).filter(lambda x: x % 2 == 0).collect())  # Output: [4, 16]
+
+    # Calling the function
+    print(add_numbers(10, 20))
+
+    # Function call
+    print(fibonacci(6))  # Output: 8
+    print(fibonacci_many([0, 1, 2, 10, 50]))  # Output: [0 1 1 55 12586269025]
+
+    y = 25
+    bar()
+    print("Outside function:", y)  # This will not affect the value of y inside the function
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Import-time budget for the package
+# Each module is imported in a fresh interpreter with python -X importtime, which reports
+# the time spent in every module it loads. The cost of a module is the time of all the
+# modules its import added on top of a bare interpreter start. A module fails the check
+# if that cost is over the budget, or if importing it loaded one of the heavy packages
+# that are only meant to be imported on first use. The package is byte-compiled first,
+# so the numbers are for a normal start and not for compiling the sources.
+#
+#     python -m bootcamp.importtime            # every module, default budget
+#     python -m bootcamp.importtime 20 sets    # a 20 ms budget, bootcamp.sets only
+
+import compileall
+import os
+import subprocess
+import sys
+
+from . import __all__ as MODULES
+
+IMPORT_BUDGET_MS = 25.0  # per module, measured on a warm file cache
+HEAVY_PACKAGES = ("numpy", "pandas", "matplotlib", "torch", "asyncio", "concurrent")
+REPEAT = 5  # fresh interpreters per module, the fastest run counts
+
+
+def _importtime(code):
+    # {module name: self time in microseconds} for one interpreter running code
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                               capture_output=True, text=True, check=True)
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def measure_import(module, repeat=REPEAT):
+    # (milliseconds, heavy packages loaded) for importing module in a fresh interpreter
+    startup = set(_importtime("pass"))
+    best = None
+    for _ in range(repeat):
+        added = {name: us for name, us in _importtime(f"import {module}").items() if name not in startup}
+        elapsed = sum(added.values()) / 1000
+        best = elapsed if best is None else min(best, elapsed)
+    heavy = sorted({name.partition(".")[0] for name in added} & set(HEAVY_PACKAGES))
+    return best, heavy
+
+
+def check_budget(modules=MODULES, budget_ms=IMPORT_BUDGET_MS):
+    # Print one line per module and return True if all of them are within budget
+    compileall.compile_dir(os.path.dirname(__file__), quiet=1)
+    ok = True
+    for name in modules:
+        elapsed, heavy = measure_import(f"{__package__}.{name}")
+        passed = elapsed <= budget_ms and not heavy
+        ok = ok and passed
+        note = f", imports {', '.join(heavy)}" if heavy else ""
+        print(f"{'ok  ' if passed else 'FAIL'} {name:<20} {elapsed:7.2f} ms{note}")
+    return ok
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    budget_ms = float(args[0]) if args else IMPORT_BUDGET_MS
+    modules = args[1:] or MODULES
+    print(f"import-time budget: {budget_ms:g} ms per module")
+    return 0 if check_budget(modules, budget_ms) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+# Reusable selections for fancy and boolean indexing
+# array[mask] scans the whole mask every time it is used, and array[indices] always
+# gathers element by element into a new array, even when the indices are one contiguous
+# range that a slice (a view, no copy at all) would cover. When the same rows are picked
+# out of many columns, the work of reading the mask can be done once:
+#
+#     rows = Selection.from_mask(prices > 100)     # looked at once
+#     high = rows.take_columns({"price": prices, "qty": quantities})
+#     rows.assign(discounts, 0.1)                  # in place
+#
+# A Selection stores whichever form is cheapest to apply: a slice when the rows form one
+# contiguous (or evenly spaced) run, a list of slices when they form a few long runs, an
+# index array (np.flatnonzero) otherwise, and the boolean mask itself when nearly all the
+# rows are selected. fill_where covers the other recipe, array[array > 3] = 0, without
+# building a full-size boolean temporary.
+
+from ._lazy import optional_import
+
+np = optional_import("numpy")  # needed by everything here, imported on first use
+
+MIN_RUN_LENGTH = 64  # average run length from which copying slices beats a gather
+# Share of selected rows from which the mask (1 byte per row) is kept instead of an index
+# array (8 bytes per selected row). np.take from indices beats np.compress at any share,
+# by about 1.5x, so the mask is only kept when the index array would be the bigger cost.
+DENSE_FRACTION = 0.9
+BLOCK_SIZE = 1 << 16  # elements per block in fill_where
+
+
+def _runs(mask):
+    # (starts, stops) of the runs of True in a 1-D boolean mask
+    edges = np.flatnonzero(np.diff(mask.view(np.int8), prepend=0, append=0))
+    return edges[::2], edges[1::2]
+
+
+class Selection:
+    # kind is "slice", "runs", "indices" or "mask"; size is the length of the axis the
+    # selection was made for, count the number of selected positions
+    __slots__ = ("kind", "key", "size", "count")
+
+    def __init__(self, kind, key, size, count):
+        self.kind = kind
+        self.key = key
+        self.size = size
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"Selection({self.kind}, {self.count} of {self.size})"
+
+    @classmethod
+    def from_mask(cls, mask):
+        mask = np.asarray(mask, dtype=bool)
+        if mask.ndim != 1:
+            raise ValueError("a Selection is made from a 1-D mask, apply it along an axis")
+        count = int(np.count_nonzero(mask))
+        if count >= DENSE_FRACTION * mask.size and count < mask.size:
+            starts, stops = _runs(mask)
+            if len(starts) > 1 and count < MIN_RUN_LENGTH * len(starts):
+                return cls("mask", mask, mask.size, count)
+            return cls._from_runs(starts, stops, mask.size, count)
+        if count == mask.size:
+            return cls("slice", slice(0, count), mask.size, count)
+        return cls.from_indices(np.flatnonzero(mask), mask.size)
+
+    @classmethod
+    def from_indices(cls, indices, size):
+        # indices must be in range(size); unsorted or repeated indices stay a gather
+        indices = np.asarray(indices, dtype=np.intp).ravel()
+        count = indices.size
+        if count == 0:
+            return cls("slice", slice(0, 0), size, 0)
+        first = int(indices[0])
+        if count == 1:
+            return cls("slice", slice(first, first + 1), size, 1)
+        steps = np.diff(indices)
+        step = int(steps[0])
+        if step > 0 and (steps == step).all():  # evenly spaced: a view with a stride
+            return cls("slice", slice(first, int(indices[-1]) + 1, step), size, count)
+        if (steps > 0).all():
+            breaks = np.flatnonzero(steps != 1) + 1
+            if len(breaks) + 1 <= count // MIN_RUN_LENGTH:
+                starts = indices[np.r_[0, breaks]]
+                stops = indices[np.r_[breaks - 1, count - 1]] + 1
+                return cls._from_runs(starts, stops, size, count)
+        return cls("indices", indices, size, count)
+
+    @classmethod
+    def _from_runs(cls, starts, stops, size, count):
+        if len(starts) == 1:
+            return cls("slice", slice(int(starts[0]), int(stops[0])), size, count)
+        return cls("runs", [slice(int(start), int(stop)) for start, stop in zip(starts, stops)], size, count)
+
+    @property
+    def is_view(self):
+        # True when take() returns a view of the input instead of a copy
+        return self.kind == "slice"
+
+    def _index(self, axis, key):
+        return (slice(None),) * axis + (key,)
+
+    def take(self, array, axis=0, out=None):
+        # array's selected positions along axis: a view for a slice, one copy otherwise
+        if array.shape[axis] != self.size:
+            raise ValueError(f"selection made for {self.size} positions, axis {axis} has {array.shape[axis]}")
+        if self.kind == "slice":
+            result = array[self._index(axis, self.key)]
+            if out is None:
+                return result
+            out[...] = result
+            return out
+        if self.kind == "indices":
+            return np.take(array, self.key, axis=axis, out=out)
+        if self.kind == "mask":
+            if out is None:
+                return array[self._index(axis, self.key)]  # faster than np.compress
+            return np.compress(self.key, array, axis=axis, out=out)
+        return np.concatenate([array[self._index(axis, run)] for run in self.key], axis=axis, out=out)
+
+    def take_columns(self, columns, axis=0):
+        # The same selection applied to every column of a dict (or DataFrame-like mapping)
+        return {name: self.take(np.asarray(column), axis=axis) for name, column in columns.items()}
+
+    def assign(self, array, values, axis=0):
+        # array[selection] = values, in place. values is a scalar or has one entry per
+        # selected position (along axis).
+        if self.kind == "slice":
+            array[self._index(axis, self.key)] = values
+        elif self.kind == "runs":
+            values = np.asarray(values)
+            if values.ndim == 0:
+                for run in self.key:
+                    array[self._index(axis, run)] = values
+            else:
+                start = 0
+                for run in self.key:
+                    length = run.stop - run.start
+                    array[self._index(axis, run)] = values[self._index(axis, slice(start, start + length))]
+                    start += length
+        elif self.kind == "mask" and axis == 0 and array.ndim == 1 and np.ndim(values) == 0:
+            np.putmask(array, self.key, values)  # no index array, no temporary
+        else:
+            array[self._index(axis, self.key)] = values
+        return array
+
+    def mask(self):
+        # The selection as a boolean mask (a new array)
+        if self.kind == "mask":
+            return self.key.copy()
+        mask = np.zeros(self.size, dtype=bool)
+        if self.kind == "runs":
+            for run in self.key:
+                mask[run] = True
+        else:
+            mask[self.key] = True
+        return mask
+
+
+def select(array, mask=None, indices=None):
+    # One-off array[mask] or array[indices] through a Selection: a view when possible
+    if (mask is None) == (indices is None):
+        raise ValueError("pass either mask or indices")
+    if mask is not None:
+        return Selection.from_mask(mask).take(array)
+    return Selection.from_indices(indices, len(array)).take(array)
+
+
+def assign_where(array, mask, values):
+    # array[mask] = values in place, without turning the mask into indices: np.putmask
+    # for a scalar, np.copyto(where=) for values shaped like array (or broadcastable)
+    if np.ndim(values) == 0:
+        np.putmask(array, mask, values)
+    else:
+        np.copyto(array, values, where=np.asarray(mask, dtype=bool))
+    return array
+
+
+def fill_where(array, predicate, value, block_size=BLOCK_SIZE):
+    # array[predicate(array)] = value, one cache-sized block at a time, so the boolean
+    # mask is never larger than a block. Returns the number of elements changed.
+    flat = array.reshape(-1)  # a view for contiguous arrays
+    if not np.shares_memory(flat, array):
+        raise ValueError("fill_where needs a contiguous array")
+    changed = 0
+    for start in range(0, flat.size, block_size):
+        block = flat[start:start + block_size]
+        mask = predicate(block)
+        changed += int(np.count_nonzero(mask))
+        np.putmask(block, mask, value)
+    return changed
+
+
+def benchmark_selection(size=10 ** 6, columns=8, selectivities=(0.001, 0.01, 0.1, 0.5, 0.9)):
+    # Filtering several columns with the same mask: array[mask] per column vs. one
+    # Selection, for random rows and for rows that form a few long runs; then the
+    # in-place update array[mask] = 0 vs. assign_where
+    import time
+
+    rng = np.random.default_rng(0)
+    data = [rng.random(size) for _ in range(columns)]
+    values = rng.random(size)
+
+    def timed(func, repeat=5):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best * 1e3
+
+    print(f"{'selected':>9} {'layout':<7} {'array[mask]':>12} {'Selection':>10}  kind")
+    for fraction in selectivities:
+        scattered = values < fraction
+        runs = np.zeros(size, dtype=bool)
+        for start in range(0, size, size // 10):  # ten runs, fraction of the rows in total
+            runs[start:start + int(fraction * size / 10)] = True
+        for layout, mask in (("random", scattered), ("runs", runs)):
+            naive = timed(lambda: [column[mask] for column in data])
+            selection = Selection.from_mask(mask)
+            reused = timed(lambda: selection.take_columns(dict(enumerate(data))))
+            print(f"{fraction:>9.1%} {layout:<7} {naive:9.2f} ms {reused:7.2f} ms  {selection.kind}")
+    mask = values < 0.5
+    target = data[0].copy()
+
+    def indexed():
+        target[mask] = 0
+
+    print(f"array[mask] = 0: {timed(indexed):.2f} ms, assign_where: "
+          f"{timed(lambda: assign_where(target, mask, 0)):.2f} ms")
+
+
+def main():
+    array = np.arange(10)
+    indices = [1, 3, 5]
+    print(Selection.from_indices(indices, len(array)))  # Output: Selection(slice, 3 of 10), a view
+    print(select(array, indices=indices))  # Output: [1 3 5]
+    Selection.from_indices(indices, len(array)).assign(array, 99)
+    print(array)  # Output: [ 0 99  2 99  4 99  6  7  8  9]
+    array = np.array([1, 2, 3, 4, 5])
+    print(select(array, mask=array > 3))  # Output: [4 5]
+    fill_where(array, lambda block: block > 3, 0)
+    print(array)  # Output: [1 2 3 0 0]
+
+
+if __name__ == "__main__":
+    main()
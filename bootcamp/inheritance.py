@@ -0,0 +1,299 @@
+import math
+import operator
+import re
+import time
+from array import array
+
+from ._lazy import optional_import
+
+np = optional_import("numpy")  # NumPy is optional, ShapeCollection loops in Python without it
+
+# Single Inheritance
+class Shape:
+    def __init__(self, color):
+        self.color = color
+
+    def display_info(self):
+        return f"Color: {self.color}"
+
+class Triangle(Shape):
+    def __init__(self, color, base, height):
+        super().__init__(color)
+        self.base = base
+        self.height = height
+
+    def display_info(self):
+        return f"Triangle - {super().display_info()}, Base: {self.base}, Height: {self.height}"
+
+# Multiple Inheritance
+class Polygon:
+    def __init__(self, sides):
+        self.sides = sides
+
+    def display_info(self):
+        return f"Sides: {self.sides}"
+
+class Pentagon(Shape, Polygon):
+    def __init__(self, color, sides, length):
+        Shape.__init__(self, color)
+        Polygon.__init__(self, sides)
+        self.length = length
+
+    def display_info(self):
+        return f"Pentagon - {super().display_info()}, {super(Pentagon, self).display_info()}, Length: {self.length}"
+
+# Method Overriding
+class Hexagon(Shape):
+    def __init__(self, color, side_length):
+        super().__init__(color)
+        self.side_length = side_length
+
+    def display_info(self):
+        return f"Hexagon - {super().display_info()}, Side Length: {self.side_length}"
+
+# Memory-compact versions of the same hierarchy
+# __slots__ replaces the per-instance __dict__ with fixed attribute slots, which saves
+# roughly 100 bytes per object. With multiple inheritance only one base may define slots,
+# so SlottedPolygon is a mixin with empty slots and SlottedPentagon declares "sides".
+# Perimeters assume the triangle is isosceles and the polygons are regular.
+#
+# display_info is not rebuilt through super() on every call either: each instance caches
+# its rendered text until an attribute changes. Each class declares a display_template
+# (or inherits one), where {field} is an attribute and {ClassName} stands for the
+# template of that class in the MRO. When a class is created, its template is resolved
+# into one flat string and split into a %-format string plus one attrgetter for its
+# fields, stored in _DISPLAY_FORMATTERS; any other braces in a template are plain text.
+# Rendering a cache miss that way costs about as much as the super() chain, so the
+# speedup comes from the cache alone.
+_DISPLAY_FORMATTERS = {}  # class -> function(instance) -> display_info text
+_TEMPLATE_FIELD = re.compile(r"\{(\w+)\}")
+
+def _resolve_template(cls):
+    # Inline every {ClassName} reference with that class's own (resolved) template; a
+    # class without a display_template of its own uses the one it inherits
+    classes = {klass.__name__: klass for klass in cls.__mro__}
+
+    def expand(match):
+        name = match.group(1)
+        if name in classes:
+            return _resolve_template(classes[name])
+        return match.group(0)
+
+    return _TEMPLATE_FIELD.sub(expand, getattr(cls, "display_template", ""))
+
+def _compile_formatter(template):
+    # "Color: {color}" -> lambda self: "Color: %s" % (self.color,), split once
+    pieces = _TEMPLATE_FIELD.split(template)  # text, field, text, field, ..., text
+    fields = pieces[1::2]
+    if not fields:
+        return lambda self: template
+    text = "%s".join(piece.replace("%", "%%") for piece in pieces[0::2])
+    getter = operator.attrgetter(*fields)  # one value, or a tuple for several fields
+    if len(fields) == 1:
+        return lambda self: text % (getter(self),)
+    return lambda self: text % getter(self)
+
+class SlottedShape:
+    __slots__ = ("color", "_display")
+    display_template = "Color: {color}"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _DISPLAY_FORMATTERS[cls] = _compile_formatter(_resolve_template(cls))
+
+    def __init__(self, color):
+        self.color = color
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_display", None)  # any change invalidates the cached text
+
+    def display_info(self):
+        text = self._display
+        if text is None:
+            text = _DISPLAY_FORMATTERS[type(self)](self)
+            object.__setattr__(self, "_display", text)
+        return text
+
+_DISPLAY_FORMATTERS[SlottedShape] = _compile_formatter(_resolve_template(SlottedShape))
+
+class SlottedTriangle(SlottedShape):
+    __slots__ = ("base", "height")
+    display_template = "Triangle - {SlottedShape}, Base: {base}, Height: {height}"
+
+    def __init__(self, color, base, height):
+        super().__init__(color)
+        self.base = base
+        self.height = height
+
+    def area(self):
+        return self.base * self.height / 2
+
+    def perimeter(self):
+        return self.base + 2 * math.hypot(self.base / 2, self.height)
+
+class SlottedPolygon:
+    __slots__ = ()
+    display_template = "Sides: {sides}"
+
+class SlottedPentagon(SlottedShape, SlottedPolygon):
+    __slots__ = ("sides", "length")
+    display_template = "Pentagon - {SlottedShape}, {SlottedPolygon}, Length: {length}"
+
+    def __init__(self, color, sides, length):
+        SlottedShape.__init__(self, color)
+        self.sides = sides
+        self.length = length
+
+    def area(self):
+        return self.sides * self.length ** 2 / (4 * math.tan(math.pi / self.sides))
+
+    def perimeter(self):
+        return self.sides * self.length
+
+class SlottedHexagon(SlottedShape):
+    __slots__ = ("side_length",)
+    display_template = "Hexagon - {SlottedShape}, Side Length: {side_length}"
+
+    def __init__(self, color, side_length):
+        super().__init__(color)
+        self.side_length = side_length
+
+    def area(self):
+        return 3 * math.sqrt(3) / 2 * self.side_length ** 2
+
+    def perimeter(self):
+        return 6 * self.side_length
+
+# Columnar storage for millions of shapes: one array per attribute instead of one object
+# per shape. Colors are stored as integer codes into a shared list of color names, and
+# area() / perimeter() work on whole columns. Strings are only built for the rows passed
+# to display_info().
+TRIANGLE, PENTAGON, HEXAGON = 0, 1, 2
+
+def _number(value):
+    # Render stored floats like the ints they usually were: 5.0 -> 5
+    return int(value) if float(value).is_integer() else value
+
+class ShapeCollection:
+    def __init__(self):
+        self.colors = []  # color code -> color name
+        self.color_codes = {}  # color name -> color code
+        self.kind = array("b")
+        self.color = array("i")
+        self.sides = array("i")
+        self.length = array("d")  # base for triangles, side length for polygons
+        self.height = array("d")  # triangles only, NaN otherwise
+
+    def __len__(self):
+        return len(self.kind)
+
+    def _codes(self, colors):
+        codes = []
+        for color in colors:
+            code = self.color_codes.get(color)
+            if code is None:
+                code = self.color_codes[color] = len(self.colors)
+                self.colors.append(color)
+            codes.append(code)
+        return codes
+
+    def _extend(self, kind, colors, sides, lengths, heights):
+        codes = self._codes(colors)
+        self.kind.extend([kind] * len(codes))
+        self.color.extend(codes)
+        self.sides.extend(sides)
+        self.length.extend(lengths)
+        self.height.extend(heights)
+
+    def add_triangles(self, colors, bases, heights):
+        self._extend(TRIANGLE, colors, [3] * len(colors), bases, heights)
+
+    def add_pentagons(self, colors, sides, lengths):
+        self._extend(PENTAGON, colors, sides, lengths, [math.nan] * len(colors))
+
+    def add_hexagons(self, colors, side_lengths):
+        self._extend(HEXAGON, colors, [6] * len(colors), side_lengths, [math.nan] * len(colors))
+
+    def add(self, shape):
+        # Add one Shape (or Slotted*) object
+        if hasattr(shape, "base"):
+            self.add_triangles([shape.color], [shape.base], [shape.height])
+        elif hasattr(shape, "side_length"):
+            self.add_hexagons([shape.color], [shape.side_length])
+        else:
+            self.add_pentagons([shape.color], [shape.sides], [shape.length])
+
+    def _columns(self):
+        return (np.frombuffer(self.kind, dtype=np.int8), np.frombuffer(self.sides, dtype=np.int32),
+                np.frombuffer(self.length, dtype=np.float64), np.frombuffer(self.height, dtype=np.float64))
+
+    def area(self):
+        if np is None:
+            return [SlottedTriangle(None, s, h).area() if k == TRIANGLE else SlottedPentagon(None, n, s).area()
+                    for k, n, s, h in zip(self.kind, self.sides, self.length, self.height)]
+        kind, sides, length, height = self._columns()
+        polygon = sides * length ** 2 / (4 * np.tan(np.pi / sides))
+        return np.where(kind == TRIANGLE, length * height / 2, polygon)
+
+    def perimeter(self):
+        if np is None:
+            return [SlottedTriangle(None, s, h).perimeter() if k == TRIANGLE else n * s
+                    for k, n, s, h in zip(self.kind, self.sides, self.length, self.height)]
+        kind, sides, length, height = self._columns()
+        triangle = length + 2 * np.hypot(length / 2, height)
+        return np.where(kind == TRIANGLE, triangle, sides * length)
+
+    def display_info(self, rows):
+        # Same text as the classes above, rendered only for the requested rows
+        lines = []
+        for row in rows:
+            color = self.colors[self.color[row]]
+            length = _number(self.length[row])
+            if self.kind[row] == TRIANGLE:
+                lines.append(f"Triangle - Color: {color}, Base: {length}, Height: {_number(self.height[row])}")
+            elif self.kind[row] == PENTAGON:
+                lines.append(f"Pentagon - Color: {color}, Sides: {self.sides[row]}, Length: {length}")
+            else:
+                lines.append(f"Hexagon - Color: {color}, Side Length: {length}")
+        return lines
+
+def benchmark_display_info(calls=10 ** 6):
+    # display_info through super() chains vs. the flattened-template formatters (a cache
+    # miss) and the cached text
+    pairs = [
+        (Triangle("Yellow", 5, 8), SlottedTriangle("Yellow", 5, 8)),
+        (Pentagon("Purple", 5, 10), SlottedPentagon("Purple", 5, 10)),
+        (Hexagon("Orange", 6), SlottedHexagon("Orange", 6)),
+    ]
+    for shape, slotted in pairs:
+        formatter = _DISPLAY_FORMATTERS[type(slotted)]
+        for label, func in (("super() chain", shape.display_info),
+                            ("formatter", lambda: formatter(slotted)),
+                            ("cached", slotted.display_info)):
+            start = time.perf_counter()
+            for _ in range(calls):
+                func()
+            elapsed = time.perf_counter() - start
+            print(f"{type(shape).__name__:<9} {label:<14} {elapsed / calls * 1e9:7.1f} ns/call")
+
+def main():
+    # Instantiating objects
+    my_triangle = Triangle("Yellow", 5, 8)
+    my_pentagon = Pentagon("Purple", 5, 10)
+    my_hexagon = Hexagon("Orange", 6)
+
+    # Using methods
+    print(my_triangle.display_info())   # Output: Triangle - Color: Yellow, Base: 5, Height: 8
+    print(my_pentagon.display_info())   # Output: Pentagon - Color: Purple, Sides: 5, Length: 10
+    print(my_hexagon.display_info())    # Output: Hexagon - Color: Orange, Side Length: 6
+
+    shapes = ShapeCollection()
+    for shape in (my_triangle, my_pentagon, my_hexagon):
+        shapes.add(shape)
+    print(shapes.display_info([1]))  # Output: ['Pentagon - Color: Purple, Sides: 5, Length: 10']
+    print(shapes.perimeter())  # Output: [21.76305461 50.         36.        ]
+
+if __name__ == "__main__":
+    main()
+
@@ -0,0 +1,138 @@
+# Input providers: where the scripts get their "user input" from
+# input() blocks on a terminal, so a script that calls it at import time cannot run in a
+# batch job or be imported by a worker process. The scripts read through a provider instead:
+#   - InteractiveInput: input() with a prompt, for a person at a terminal
+#   - StreamInput: reads sys.stdin.buffer (or any binary stream) in large chunks and splits
+#     the lines itself, for piped or redirected input
+#   - AsyncStreamInput: the same lines through an asyncio StreamReader, for async code
+# All of them offer read_line(prompt, default) and iteration over the remaining lines.
+# At end of input, read_line returns default, or raises EOFError like input() when no
+# default is given. asyncio is only imported by AsyncStreamInput, when it is first used.
+
+import sys
+
+READ_CHUNK = 1 << 20  # bytes read from the stream per call
+
+
+class InteractiveInput:
+    interactive = True
+
+    def read_line(self, prompt="", default=None):
+        try:
+            return input(prompt)
+        except EOFError:
+            if default is None:
+                raise
+            return default
+
+    def lines(self):
+        while True:
+            try:
+                yield input()
+            except EOFError:
+                return
+
+    def __iter__(self):
+        return self.lines()
+
+
+class StreamInput:
+    interactive = False
+
+    def __init__(self, stream=None, encoding="utf-8", chunk_size=READ_CHUNK):
+        if stream is None:
+            stream = sys.stdin.buffer if sys.stdin is not None else None
+        self.stream = stream
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+        self._lines = self._read_lines()
+
+    def _read_lines(self):
+        # One read per chunk_size bytes at most instead of one readline() per record.
+        # read1() returns whatever is already available, so a line written to a pipe is
+        # handed out at once instead of after chunk_size bytes or end of input.
+        if self.stream is None:
+            return
+        read = getattr(self.stream, "read1", self.stream.read)
+        tail = b""
+        while True:
+            chunk = read(self.chunk_size)
+            if not chunk:
+                break
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()
+            for line in lines:
+                yield line.rstrip(b"\r").decode(self.encoding)
+        if tail:
+            yield tail.rstrip(b"\r").decode(self.encoding)
+
+    def read_line(self, prompt="", default=None):
+        # The prompt is not shown: nobody is there to read it
+        line = next(self._lines, None)
+        if line is None:
+            if default is None:
+                raise EOFError("no more input")
+            return default
+        return line
+
+    def lines(self):
+        return self._lines
+
+    def __iter__(self):
+        return self._lines
+
+
+class AsyncStreamInput:
+    interactive = False
+
+    def __init__(self, stream=None, encoding="utf-8"):
+        self.stream = stream if stream is not None else sys.stdin
+        self.encoding = encoding
+        self._reader = None
+        self._fallback = None
+
+    async def _connect(self):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=READ_CHUNK)
+        try:
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), self.stream)
+        except (OSError, ValueError):
+            # Regular files cannot be watched by the event loop, so read them in bulk in a
+            # worker thread instead
+            buffer = getattr(self.stream, "buffer", self.stream)
+            self._fallback = StreamInput(buffer, self.encoding)
+        self._reader = reader
+
+    async def read_line(self, prompt="", default=None):
+        import asyncio
+
+        if self._reader is None:
+            await self._connect()
+        if self._fallback is not None:
+            line = await asyncio.get_running_loop().run_in_executor(None, next, self._fallback.lines(), None)
+        else:
+            data = await self._reader.readline()
+            line = data.rstrip(b"\r\n").decode(self.encoding) if data else None
+        if line is None:
+            if default is None:
+                raise EOFError("no more input")
+            return default
+        return line
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self.read_line()
+        except EOFError:
+            raise StopAsyncIteration from None
+
+
+def get_input_provider(stream=None):
+    # Ask the user when stdin is a terminal, otherwise read the piped input in bulk
+    if stream is None and sys.stdin is not None and sys.stdin.isatty():
+        return InteractiveInput()
+    return StreamInput(stream)
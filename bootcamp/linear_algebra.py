@@ -0,0 +1,220 @@
+# Linear algebra for matrices that do not fit in memory, or come in large stacks
+# The np.linalg recipes in the NumPy notes load whole matrices. The functions here stream
+# their operands (NumPy arrays, or np.memmap views such as array_store.load_array gives)
+# through memory a block at a time:
+#   - blocked_matmul: a @ b tile by tile, into an array or a new .npy file
+#   - randomized_svd: the top k singular triplets of a tall matrix in a few passes over it
+#   - solve_batched: a whole stack of small systems (k, n, n) in a few LAPACK calls
+#   - inverse: an inverse that solves instead of inverting
+#
+# About inv: x = np.linalg.inv(a) @ b costs about three times the work of
+# np.linalg.solve(a, b) and is less accurate, because the inverse is rounded before it is
+# multiplied. Whenever the inverse is only used to solve a @ x = b, use solve, or
+# inverse(a) @ b, which calls solve (and reuses one LU factorization for many right-hand
+# sides when SciPy is installed). Only build the actual matrix (np.asarray(inverse(a)))
+# when its entries are the result you want. In the same way, np.linalg.slogdet avoids the
+# overflow of np.linalg.det for large matrices.
+
+from math import isqrt
+
+from ._lazy import optional_import
+
+np = optional_import("numpy")  # needed by everything here, imported on first use
+scipy_linalg = optional_import("scipy.linalg")  # optional, lets inverse() reuse an LU factorization
+
+MEMORY_LIMIT = 256 << 20  # bytes of operand blocks held in memory at once
+BATCH_SIZE = 1 << 14  # systems per call in solve_batched
+
+
+def _tile_size(itemsize, memory_limit):
+    # Edge of the square tiles: one tile each of a, b and the result fit in memory_limit
+    return max(1, isqrt(memory_limit // (3 * itemsize)))
+
+
+def blocked_matmul(a, b, out=None, out_path=None, memory_limit=MEMORY_LIMIT):
+    # a @ b for 2-D operands of any size: a is read in (tile x tile) blocks and so is b,
+    # and each block of the result is summed in memory and written once. The result goes
+    # into out, into a new .npy file at out_path (returned as a writable memmap), or into a
+    # new in-memory array.
+    if a.ndim != 2 or b.ndim != 2 or a.shape[1] != b.shape[0]:
+        raise ValueError(f"cannot multiply shapes {a.shape} and {b.shape}")
+    rows, inner = a.shape
+    columns = b.shape[1]
+    dtype = np.result_type(a.dtype, b.dtype)
+    if out is None:
+        if out_path is not None:
+            out = np.lib.format.open_memmap(out_path, mode="w+", dtype=dtype, shape=(rows, columns))
+        else:
+            out = np.empty((rows, columns), dtype=dtype)
+    elif out.shape != (rows, columns):
+        raise ValueError(f"out has shape {out.shape}, expected {(rows, columns)}")
+    tile = _tile_size(dtype.itemsize, memory_limit)
+    for i in range(0, rows, tile):
+        for j in range(0, columns, tile):
+            block = np.zeros((min(tile, rows - i), min(tile, columns - j)), dtype=dtype)
+            for k in range(0, inner, tile):
+                block += np.asarray(a[i:i + tile, k:k + tile]) @ np.asarray(b[k:k + tile, j:j + tile])
+            out[i:i + tile, j:j + tile] = block
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+def _row_blocks(a, memory_limit):
+    # Consecutive row blocks of a, each about memory_limit / 4 bytes, read into memory
+    block_rows = max(1, memory_limit // (4 * a.shape[1] * a.dtype.itemsize))
+    for start in range(0, a.shape[0], block_rows):
+        yield start, np.asarray(a[start:start + block_rows], dtype=np.float64)
+
+
+def randomized_svd(a, k, oversample=10, power_iterations=2, seed=None, compute_u=True,
+                   memory_limit=MEMORY_LIMIT):
+    # Top k singular values and vectors of a tall (m x n, m >> n) matrix, as (U, S, Vt)
+    # with the shapes of np.linalg.svd(a, full_matrices=False) truncated to k. a is only
+    # read in row blocks, power_iterations + 3 times (+ 2 without U), and apart from U
+    # (m x k) nothing larger than n x (k + oversample) is kept.
+    rows, columns = a.shape
+    width = min(k + oversample, columns)
+    rng = np.random.default_rng(seed)
+    # Range finder on the row space: subspace iteration Q <- orth(a.T @ a @ Q)
+    q = np.linalg.qr(rng.standard_normal((columns, width)))[0]
+    for _ in range(power_iterations + 1):
+        z = np.zeros((columns, width))
+        for _, block in _row_blocks(a, memory_limit):
+            z += block.T @ (block @ q)
+        q = np.linalg.qr(z)[0]
+    # R factor of C = a @ Q by streaming QR (TSQR): each block is stacked under the R so
+    # far and factored again, which is as accurate as factoring all of C at once
+    r = np.zeros((0, width))
+    for _, block in _row_blocks(a, memory_limit):
+        r = np.linalg.qr(np.vstack((r, block @ q)), mode="r")
+    u_r, s, wt = np.linalg.svd(r)
+    s, u_r = s[:k], u_r[:, :k]
+    vt = (q @ wt.T[:, :k]).T
+    if not compute_u:
+        return None, s, vt
+    # U = C @ W / S, one more pass over a; zero singular values give zero columns
+    scale = np.divide(1.0, s, out=np.zeros_like(s), where=s > 0)
+    projection = q @ wt.T[:, :k] * scale
+    u = np.empty((rows, len(s)))
+    for start, block in _row_blocks(a, memory_limit):
+        u[start:start + len(block)] = block @ projection
+    return u, s, vt
+
+
+def solve_batched(a, b, out=None, batch_size=BATCH_SIZE, singular="raise"):
+    # Solve a[i] @ x[i] = b[i] for a stack a of shape (k, n, n) and b of shape (k, n) or
+    # (k, n, m). np.linalg.solve loops over the stack inside one call, so the work is done
+    # batch_size systems at a time (which also bounds the memory used for memmap input).
+    # singular="nan" fills the solutions of singular systems with NaN instead of raising.
+    if a.ndim != 3 or a.shape[1] != a.shape[2]:
+        raise ValueError(f"expected a stack of square matrices, got shape {a.shape}")
+    vectors = b.ndim == 2  # one right-hand side per system
+    if b.shape[0] != a.shape[0] or b.shape[1] != a.shape[1]:
+        raise ValueError(f"right-hand sides of shape {b.shape} do not match systems of shape {a.shape}")
+    if out is None:
+        out = np.empty(b.shape, dtype=np.result_type(a.dtype, b.dtype, np.float64))
+    for start in range(0, a.shape[0], batch_size):
+        stop = min(start + batch_size, a.shape[0])
+        systems = np.asarray(a[start:stop])
+        rhs = np.asarray(b[start:stop])
+        if vectors:
+            rhs = rhs[..., np.newaxis]  # NumPy 2 reads a 2-D b as one matrix, not a stack
+        try:
+            x = np.linalg.solve(systems, rhs)
+        except np.linalg.LinAlgError:
+            if singular != "nan":
+                raise
+            x = np.full(rhs.shape, np.nan)
+            for i in range(len(systems)):
+                try:
+                    x[i] = np.linalg.solve(systems[i], rhs[i])
+                except np.linalg.LinAlgError:
+                    pass  # stays NaN
+        out[start:stop] = x[..., 0] if vectors else x
+    return out
+
+
+class Inverse:
+    # Stands for inv(a) in products: inverse(a) @ b solves a @ x = b, and x @ inverse(a)
+    # solves x @ a = y through a.T. With SciPy the LU factorization is computed once and
+    # reused by every product.
+    __array_ufunc__ = None  # ndarray @ Inverse calls __rmatmul__ instead of converting it
+
+    def __init__(self, a):
+        self.a = np.asarray(a)
+        if self.a.ndim != 2 or self.a.shape[0] != self.a.shape[1]:
+            raise ValueError(f"expected a square matrix, got shape {self.a.shape}")
+        self._lu = None
+        self._matrix = None
+
+    @property
+    def shape(self):
+        return self.a.shape
+
+    def solve(self, b, transposed=False):
+        if scipy_linalg is not None:
+            if self._lu is None:
+                self._lu = scipy_linalg.lu_factor(self.a)
+            return scipy_linalg.lu_solve(self._lu, b, trans=1 if transposed else 0)
+        return np.linalg.solve(self.a.T if transposed else self.a, b)
+
+    def __matmul__(self, b):
+        return self.solve(b)
+
+    def __rmatmul__(self, x):
+        # x @ inv(a) == (inv(a).T @ x.T).T == solve(a.T, x.T).T
+        return self.solve(np.asarray(x).T, transposed=True).T
+
+    def __array__(self, dtype=None, copy=None):
+        # The actual matrix, only built when something asks for its entries
+        if self._matrix is None:
+            self._matrix = np.linalg.inv(self.a)
+        return self._matrix if dtype is None else self._matrix.astype(dtype)
+
+
+def inverse(a):
+    return Inverse(a)
+
+
+def benchmark_solve(n=500, right_hand_sides=50, systems=10_000, size=4):
+    # inv(a) @ b vs. solve vs. inverse(a) @ b, and a stack of small systems solved one
+    # by one vs. with solve_batched
+    import time
+
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((n, n)) + n * np.eye(n)
+    b = rng.standard_normal((n, right_hand_sides))
+    for label, func in (("inv(a) @ b", lambda: np.linalg.inv(a) @ b),
+                        ("solve(a, b)", lambda: np.linalg.solve(a, b)),
+                        ("inverse(a) @ b", lambda: inverse(a) @ b)):
+        start = time.perf_counter()
+        x = func()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<16} {elapsed * 1e3:8.2f} ms, residual {np.abs(a @ x - b).max():.1e}")
+    stack = rng.standard_normal((systems, size, size)) + size * np.eye(size)
+    rhs = rng.standard_normal((systems, size))
+    start = time.perf_counter()
+    for i in range(systems):
+        np.linalg.solve(stack[i], rhs[i])
+    loop = time.perf_counter() - start
+    start = time.perf_counter()
+    solve_batched(stack, rhs)
+    batched = time.perf_counter() - start
+    print(f"{systems} {size}x{size} systems: loop {loop * 1e3:.1f} ms, solve_batched {batched * 1e3:.1f} ms")
+
+
+def main():
+    A = np.array([[3, 1], [1, 2]])
+    b = np.array([9, 8])
+    print(inverse(A) @ b)  # Output: [2. 3.], same as np.linalg.solve(A, b)
+    A_inv = inverse(A)
+    print(np.array([[9, 8]]) @ A_inv, A_inv._matrix is None)  # Output: [[2. 3.]] True, solved without inv
+    print(blocked_matmul(A, np.eye(2), memory_limit=48))  # Output: [[3. 1.] [1. 2.]], 1x1 tiles
+    matrix = np.array([[1, 2], [3, 4], [5, 6]])
+    print(randomized_svd(matrix, 1, seed=0)[1])  # Output: [9.52551809], np.linalg.svd's first value
+    print(solve_batched(np.stack([A, 2 * A]), np.stack([b, b])))  # Output: [[2. 3.] [1. 1.5]]
+
+
+if __name__ == "__main__":
+    main()
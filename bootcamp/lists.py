@@ -0,0 +1,143 @@
+# Notes:
+# A list is an ordered, mutable collection of items.
+# Lists can contain elements of different data types.
+# Lists are defined using square brackets [].
+
+import heapq
+from array import array
+from itertools import islice
+
+from ._lazy import optional_import
+
+np = optional_import("numpy")  # NumPy is optional, the reductions fall back to the built-ins
+
+# Algorithm 1: Find the maximum value in a list
+# NumPy arrays (and array.array, viewed without a copy) are reduced in C with np.max, and
+# everything else goes through the built-in max(), which also streams over iterators
+_NO_DEFAULT = object()
+_MIN_MAX_BLOCK = 1 << 16  # elements per block, small enough to stay in cache
+
+def _as_ndarray(numbers):
+    # Zero-copy NumPy view of array input, or None for anything else
+    if np is None:
+        return None
+    if isinstance(numbers, np.ndarray):
+        return numbers
+    if isinstance(numbers, array):
+        return np.frombuffer(numbers, dtype=numbers.typecode) if len(numbers) else np.array([])
+    return None
+
+def find_maximum(numbers, default=_NO_DEFAULT):
+    values = _as_ndarray(numbers)
+    if values is not None:
+        if values.size:
+            return values.max()
+    else:
+        sentinel = object()
+        result = max(numbers, default=sentinel)
+        if result is not sentinel:
+            return result
+    if default is _NO_DEFAULT:
+        raise ValueError("find_maximum() arg is an empty sequence")
+    return default
+
+# Algorithm 2: Maximum of a stream delivered in chunks (lists, arrays or blocks of a file)
+# Only one chunk is in memory at a time; plain iterators are cut into chunk_size pieces
+def find_maximum_chunked(chunks, default=_NO_DEFAULT, chunk_size=None):
+    if chunk_size is not None:
+        iterator = iter(chunks)
+        chunks = iter(lambda: list(islice(iterator, chunk_size)), [])
+    partial = [find_maximum(chunk, default=None) for chunk in chunks]
+    return find_maximum([value for value in partial if value is not None], default=default)
+
+# Algorithm 3: The k largest values, largest first
+def top_k(numbers, k):
+    values = _as_ndarray(numbers)
+    if values is None:
+        # heapq keeps only k items at a time, so iterators of any length are fine
+        return heapq.nlargest(k, numbers)
+    if k <= 0:
+        return values[:0]
+    if k < values.size:
+        # argpartition finds the k largest in O(n) without sorting the whole array
+        values = values[np.argpartition(values, values.size - k)[values.size - k:]]
+    return np.sort(values)[::-1]
+
+# Algorithm 4: Minimum and maximum together
+def min_max(numbers):
+    values = _as_ndarray(numbers)
+    if values is not None:
+        if not values.size:
+            raise ValueError("min_max() arg is an empty sequence")
+        # Reduce block by block so the max pass re-reads data the min pass left in cache
+        values = values.ravel()
+        lows, highs = [], []
+        for start in range(0, values.size, _MIN_MAX_BLOCK):
+            block = values[start:start + _MIN_MAX_BLOCK]
+            lows.append(block.min())
+            highs.append(block.max())
+        return min(lows), max(highs)
+    if isinstance(numbers, (list, tuple)):
+        if not numbers:
+            raise ValueError("min_max() arg is an empty sequence")
+        return min(numbers), max(numbers)  # two passes in C beat one pass in Python
+    # One-shot iterator: compare items in pairs, 3 comparisons per 2 items
+    iterator = iter(numbers)
+    try:
+        low = high = next(iterator)
+    except StopIteration:
+        raise ValueError("min_max() arg is an empty sequence") from None
+    for first in iterator:
+        second = next(iterator, first)
+        if second < first:
+            first, second = second, first
+        if first < low:
+            low = first
+        if second > high:
+            high = second
+    return low, high
+
+def main():
+    # Common Operations:
+    # Creating a list
+    my_list = [1, 2, 3, 4]
+
+    # Accessing elements
+    print(my_list[0])  # Output: 1
+
+    # Slicing a list
+    print(my_list[1:3])  # Output: [2, 3]
+
+    # Adding elements
+    my_list.append(5)
+    print(my_list)  # Output: [1, 2, 3, 4, 5]
+
+    my_list.insert(2, 10)
+    print(my_list)  # Output: [1, 2, 10, 3, 4, 5]
+
+    # Removing elements
+    my_list.remove(3)
+    print(my_list)  # Output: [1, 2, 10, 4, 5]
+
+    my_list.pop()
+    print(my_list)  # Output: [1, 2, 10, 4]
+
+    # List comprehension
+    squares = [x**2 for x in range(5)]
+    print(squares)  # Output: [0, 1, 4, 9, 16]
+
+    # Example usage
+    numbers = [1, 5, 2, 9, 3]
+    print(find_maximum(numbers))  # Output: 9
+
+    # Example usage
+    print(find_maximum_chunked([[1, 5], [], [2, 9, 3]]))  # Output: 9
+
+    # Example usage
+    print(top_k(numbers, 2))  # Output: [9, 5]
+
+    # Example usage
+    print(min_max(numbers))  # Output: (1, 9)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+# Buffered output for print-heavy scripts
+# Every print() to a terminal or pipe is a separate write (and often a flush). An
+# OutputSink collects the text of many print calls in memory and writes it out in one go
+# when the buffer reaches buffer_size characters, when the oldest pending text is older
+# than flush_interval seconds, before the process forks, and at exit. The target is a
+# stream or a MappedFile, where writing is a memory copy into the page cache and needs no
+# system call at all. By default it is whatever sys.stdout is at the time of each print,
+# so contextlib.redirect_stdout and pytest's capsys see the text like the built-in print's.
+#
+#     from bootcamp.output_sink import stdout_sink
+#     print = stdout_sink.print  # same sep/end semantics as the built-in
+
+import atexit
+import mmap
+import os
+import sys
+import threading
+import time
+import weakref
+
+BUFFER_SIZE = 1 << 20  # characters collected before a write
+FLUSH_INTERVAL = 0.5  # seconds pending text may wait, checked on every print
+
+_sinks = weakref.WeakSet()
+
+
+class StreamTarget:
+    # Binary writes to a text stream such as sys.stdout, kept in order with its own text.
+    # With stream=None it follows sys.stdout: the sink calls follow() when it was replaced.
+    def __init__(self, stream=None):
+        self.follows_stdout = stream is None
+        self.stream = stream
+        self.in_memory = False  # a StringIO or capture buffer: nothing to save by waiting
+
+    def follow(self):
+        # Switch to the current sys.stdout
+        self.stream = sys.stdout
+        try:
+            self.stream.fileno()
+            self.in_memory = False
+        except (AttributeError, OSError, ValueError):  # io.UnsupportedOperation is both
+            self.in_memory = True
+
+    def write(self, data):
+        self.stream.flush()  # anything written to the text layer directly goes first
+        buffer = getattr(self.stream, "buffer", None)
+        if buffer is not None:
+            buffer.write(data)
+            buffer.flush()
+        else:
+            self.stream.write(data.decode(getattr(self.stream, "encoding", None) or "utf-8"))
+            self.stream.flush()
+
+    def close(self):
+        pass
+
+
+class MappedFile:
+    # Append-only file written through a memory map that grows in steps of grow_by bytes;
+    # close() trims the file to the bytes actually written
+    def __init__(self, path, grow_by=64 << 20):
+        self.file = open(path, "w+b")
+        self.grow_by = grow_by
+        self.size = 0
+        self.capacity = 0
+        self.map = None
+
+    def _grow(self, needed):
+        if self.map is not None:
+            self.map.close()
+        self.capacity = max(self.capacity + self.grow_by, needed)
+        self.file.truncate(self.capacity)
+        self.map = mmap.mmap(self.file.fileno(), self.capacity)
+
+    def write(self, data):
+        end = self.size + len(data)
+        if end > self.capacity:
+            self._grow(end)
+        self.map[self.size:end] = data
+        self.size = end
+
+    def close(self):
+        if self.file.closed:
+            return
+        if self.map is not None:
+            self.map.flush()
+            self.map.close()
+            self.map = None
+        self.file.truncate(self.size)
+        self.file.close()
+
+
+class OutputSink:
+    def __init__(self, target=None, buffer_size=BUFFER_SIZE, flush_interval=FLUSH_INTERVAL,
+                 encoding="utf-8"):
+        self.target = target if target is not None else StreamTarget()
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.encoding = encoding
+        self.parts = []
+        self.pending = 0  # characters in parts
+        self.oldest = None  # time.monotonic() of the oldest pending text
+        self.lock = threading.Lock()
+        _sinks.add(self)
+
+    def write(self, text):
+        if not text:
+            return
+        with self.lock:
+            follows_stdout = getattr(self.target, "follows_stdout", False)
+            if follows_stdout and sys.stdout is not self.target.stream:
+                self._flush()  # pending text goes to the stream it was printed to
+                self.target.follow()
+            now = time.monotonic()
+            if self.oldest is None:
+                self.oldest = now
+            self.parts.append(text)
+            self.pending += len(text)
+            if (self.pending >= self.buffer_size or now - self.oldest >= self.flush_interval
+                    or follows_stdout and self.target.in_memory):
+                self._flush()
+
+    def print(self, *values, sep=" ", end="\n", file=None, flush=False):
+        # Drop-in for the built-in print(); file= other than this sink goes to print()
+        if file is not None and file is not self:
+            print(*values, sep=sep, end=end, file=file, flush=flush)
+            return
+        sep = " " if sep is None else sep
+        end = "\n" if end is None else end
+        self.write(sep.join(map(str, values)) + end)
+        if flush:
+            self.flush()
+
+    def _flush(self):
+        if self.parts:
+            data = "".join(self.parts).encode(self.encoding)
+            self.parts = []
+            self.pending = 0
+            self.oldest = None
+            self.target.write(data)
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def close(self):
+        self.flush()
+        self.target.close()
+        _sinks.discard(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _flush_all():
+    for sink in list(_sinks):
+        try:
+            sink.flush()
+        except (OSError, ValueError):  # the target is already closed
+            pass
+
+
+# A forked child would otherwise inherit (and later repeat) the parent's pending text
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_flush_all)
+atexit.register(_flush_all)
+
+stdout_sink = OutputSink()
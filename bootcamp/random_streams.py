@@ -0,0 +1,253 @@
+# Reproducible random numbers for parallel jobs
+# The NumPy notes use np.random.random, np.random.randint and np.random.normal, which all
+# draw from one hidden global generator. Its numbers depend on the order in which the
+# calls happen, so splitting the work over threads or processes gives different results
+# on every run (and forked workers can even repeat each other's numbers). Here every task
+# gets its own np.random.Generator, made from the run's seed and the task's index with
+# SeedSequence:
+#
+#     streams = RandomStreams(seed=2024)
+#     results = streams.map(simulate, range(1000), workers=64)   # simulate(rng, task)
+#
+# Task i always draws from stream i, whichever worker runs it, so the results are the same
+# bit for bit for any number of processes (or threads, or none). Without a seed, fresh
+# entropy is used and kept in streams.entropy, so a lucky run can still be repeated.
+#
+# fill() and parallel_fill() write into an existing array instead of allocating a new one
+# (Generator methods take out=), and RandomBlocks generates the next blocks in a
+# background thread while the current one is being used.
+
+import os
+
+from ._lazy import optional_import
+
+np = optional_import("numpy")  # needed by everything here, imported on first use
+
+CHUNK_SIZE = 1 << 18  # elements per stream in parallel_fill and per block in RandomBlocks
+
+# Distributions that fill an out= array directly, with no parameters. Others (uniform,
+# normal with a mean and scale, ...) are made from these in place: see fill().
+_FILLS = ("random", "standard_normal", "standard_exponential")
+
+
+class RandomStreams:
+    def __init__(self, seed=None):
+        # seed is an int, a SeedSequence, or None for fresh entropy; stream(i) depends only
+        # on it and i
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+
+    @property
+    def entropy(self):
+        # The seed to pass to RandomStreams to repeat this run
+        return self.seed_sequence.entropy
+
+    def __repr__(self):
+        return f"RandomStreams(seed={self.entropy})"
+
+    def seed_for(self, index):
+        # The same SeedSequence that the index-th child of seed_sequence.spawn() would be
+        return np.random.SeedSequence(self.entropy, spawn_key=self.seed_sequence.spawn_key + (index,))
+
+    def stream(self, index):
+        # Generator number index: independent of every other stream of this seed
+        return np.random.Generator(np.random.PCG64(self.seed_for(index)))
+
+    def streams(self, count, start=0):
+        return [self.stream(index) for index in range(start, start + count)]
+
+    def map(self, func, tasks, workers=None, processes=True):
+        # [func(stream(i), task) for i, task in enumerate(tasks)], in a process pool (or a
+        # thread pool with processes=False). func must be picklable for processes, a
+        # module-level function for example. Only the seed and the task index are sent to
+        # the workers; each one makes its generators itself.
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        jobs = [(func, index, task) for index, task in enumerate(tasks)]
+        if not processes:
+            with ThreadPoolExecutor(workers) as pool:
+                return list(pool.map(lambda job: job[0](self.stream(job[1]), job[2]), jobs))
+        chunksize = max(1, len(jobs) // (4 * (workers or os.cpu_count() or 1)))
+        with ProcessPoolExecutor(workers, initializer=_init_stream_worker,
+                                 initargs=(self.seed_sequence,)) as pool:
+            return list(pool.map(_run_task, jobs, chunksize=chunksize))
+
+
+# Worker processes rebuild the RandomStreams from its SeedSequence once, in the pool
+# initializer
+_worker_streams = None
+
+
+def _init_stream_worker(seed_sequence):
+    global _worker_streams
+    _worker_streams = RandomStreams(seed_sequence)
+
+
+def _run_task(job):
+    func, index, task = job
+    return func(_worker_streams.stream(index), task)
+
+
+def fill(generator, out, distribution="random", loc=0.0, scale=1.0):
+    # Fill out (a float32 or float64 array) in place from generator: "random" gives
+    # uniform [loc, loc + scale), "standard_normal" normal with mean loc and standard
+    # deviation scale, "standard_exponential" exponential with the given scale (plus loc).
+    # Nothing as large as out is allocated.
+    if distribution not in _FILLS:
+        raise ValueError(f"distribution must be one of {_FILLS}, got {distribution!r}")
+    getattr(generator, distribution)(dtype=out.dtype, out=out)
+    if scale != 1.0:
+        np.multiply(out, scale, out=out)
+    if loc != 0.0:
+        np.add(out, loc, out=out)
+    return out
+
+
+def _fill_chunk(streams, out, index, chunk_size, distribution, loc, scale):
+    fill(streams.stream(index), out[index * chunk_size:(index + 1) * chunk_size], distribution, loc, scale)
+
+
+def parallel_fill(out, seed=None, distribution="random", loc=0.0, scale=1.0, workers=None,
+                  chunk_size=CHUNK_SIZE):
+    # fill() for a large contiguous array, chunk_size elements per stream, in a thread pool
+    # (the Generator fills release the GIL). Chunk i always comes from stream i, so the
+    # values depend on seed and chunk_size but not on workers. Returns out.
+    from concurrent.futures import ThreadPoolExecutor
+
+    streams = seed if isinstance(seed, RandomStreams) else RandomStreams(seed)
+    flat = out.reshape(-1)  # a view for contiguous arrays
+    if not np.shares_memory(flat, out):
+        raise ValueError("parallel_fill needs a contiguous array")
+    chunks = -(-flat.size // chunk_size)
+    with ThreadPoolExecutor(workers) as pool:
+        for future in [pool.submit(_fill_chunk, streams, flat, index, chunk_size, distribution, loc, scale)
+                       for index in range(chunks)]:
+            future.result()  # re-raises any error from the worker
+    return out
+
+
+class RandomBlocks:
+    # Endless blocks of random numbers from one stream, generated ahead in a background
+    # thread. Each block is an array of shape block_shape that stays valid until the next
+    # one is taken: the buffers are reused, depth of them filled ahead plus the one in use,
+    # so a consumer that is slower than the generator never waits after the first block.
+    #
+    #     with RandomBlocks(streams.stream(0), (1024, 3)) as blocks:
+    #         for _ in range(steps):
+    #             walk += next(blocks)
+    def __init__(self, generator, block_shape=(CHUNK_SIZE,), dtype="float64", distribution="random",
+                 loc=0.0, scale=1.0, depth=2):
+        import queue
+        import threading
+
+        self.generator = generator
+        self.distribution, self.loc, self.scale = distribution, loc, scale
+        self._free = queue.Queue()
+        self._ready = queue.Queue()
+        for _ in range(depth + 1):
+            self._free.put(np.empty(block_shape, dtype=dtype))
+        self._current = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def _produce(self):
+        while not self._stopped.is_set():
+            buffer = self._free.get()
+            if buffer is None:  # close() wakes the thread up with None
+                break
+            try:
+                fill(self.generator, buffer, self.distribution, self.loc, self.scale)
+            except Exception as error:
+                self._ready.put(error)
+                break
+            self._ready.put(buffer)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._stopped.is_set():
+            raise StopIteration
+        if self._current is not None:
+            self._free.put(self._current)  # the previous block can be refilled now
+        block = self._ready.get()
+        if isinstance(block, Exception):
+            self._current = None
+            raise block
+        self._current = block
+        return block
+
+    def close(self):
+        self._stopped.set()
+        self._free.put(None)
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _mean_of_normals(rng, size):
+    return rng.standard_normal(size).mean()
+
+
+def benchmark_random(size=10 ** 7, blocks=50, block_size=CHUNK_SIZE):
+    # A new array per call (the legacy global API) vs. filling one preallocated array,
+    # and a consumer that generates its own blocks vs. one fed by RandomBlocks
+    import time
+
+    def timed(func, repeat=5):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best * 1e3
+
+    out = np.empty(size)
+    rng = RandomStreams(0).stream(0)
+    print(f"np.random.normal(size=n)  {timed(lambda: np.random.normal(size=size)):8.2f} ms")
+    print(f"rng.standard_normal(n)    {timed(lambda: rng.standard_normal(size)):8.2f} ms")
+    print(f"fill(rng, out, normal)    {timed(lambda: fill(rng, out, 'standard_normal')):8.2f} ms")
+    print(f"parallel_fill(out)        {timed(lambda: parallel_fill(out, 0, 'standard_normal')):8.2f} ms")
+
+    total = np.zeros(block_size)
+
+    def consume(block):
+        np.add(total, np.sqrt(np.abs(block)), out=total)  # work done on each block
+
+    def inline():
+        for _ in range(blocks):
+            consume(rng.standard_normal(block_size))
+
+    def prefetched():
+        with RandomBlocks(rng, (block_size,), distribution="standard_normal") as source:
+            for _ in range(blocks):
+                consume(next(source))
+
+    print(f"{blocks} blocks, generated inline   {timed(inline):8.2f} ms")
+    print(f"{blocks} blocks, from RandomBlocks  {timed(prefetched):8.2f} ms")
+
+
+def main():
+    streams = RandomStreams(seed=42)
+    print(streams.stream(0).integers(0, 10, 5))  # Output: the same five integers on every run
+    print(RandomStreams(seed=42).stream(0).integers(0, 10, 5))  # Output: the same five again
+    serial = [_mean_of_normals(streams.stream(i), 1000) for i in range(8)]
+    parallel = streams.map(_mean_of_normals, [1000] * 8, workers=2)
+    print(serial == parallel)  # Output: True, bit for bit, for any number of workers
+    out = np.empty(6)
+    print(parallel_fill(out, seed=42, chunk_size=2, workers=3).round(3))  # Output: six uniform values
+    print(np.array_equal(out, parallel_fill(np.empty(6), seed=42, chunk_size=2, workers=1)))  # Output: True
+    with RandomBlocks(streams.stream(1), (2, 3), distribution="standard_normal") as blocks:
+        print(next(blocks).shape)  # Output: (2, 3)
+
+
+# Worker processes import this module to find _run_task, so the demo only runs here
+if __name__ == "__main__":
+    main()
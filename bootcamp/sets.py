@@ -0,0 +1,280 @@
+# Notes:
+# A set is an unordered collection of unique elements.
+# Sets are defined using curly braces {} or the set() function.
+# Sets are mutable, but their elements must be immutable.
+
+import hashlib
+import math
+import mmap
+import numbers
+import operator
+import struct
+from collections import Counter
+
+from ._lazy import optional_import
+
+np = optional_import("numpy")  # NumPy is optional, only needed for array input
+
+# The algorithms below keep the order of their input (a set does not), and arrays take
+# NumPy paths that sort instead of hashing one Python object per element
+
+# Algorithm 1: Remove duplicates from a list, keeping the first occurrence of each item
+def remove_duplicates(input_list):
+    if np is not None and isinstance(input_list, np.ndarray):
+        _, first_index = np.unique(input_list, return_index=True)
+        return input_list[np.sort(first_index)]
+    # dict keys are unique and remember insertion order
+    return list(dict.fromkeys(input_list))
+
+# Algorithm 2: Find common elements in two lists, in the order of list1
+def find_common_elements(list1, list2, assume_unique=False):
+    if np is not None and isinstance(list1, np.ndarray) and isinstance(list2, np.ndarray):
+        # Sorted result; assume_unique=True skips the deduplication of both inputs
+        return np.intersect1d(list1, list2, assume_unique=assume_unique)
+    # Only the smaller input is stored in a hash table, the larger one is just scanned
+    if len(list1) <= len(list2):
+        common = set(list1).intersection(list2)
+        return [item for item in dict.fromkeys(list1) if item in common]
+    smaller = set(list2)
+    return list(dict.fromkeys(item for item in list1 if item in smaller))
+
+# Algorithm 3: Find the elements that appear exactly once in a list
+def find_unique_elements(input_list):
+    if np is not None and isinstance(input_list, np.ndarray):
+        _, first_index, counts = np.unique(input_list, return_index=True, return_counts=True)
+        return input_list[np.sort(first_index[counts == 1])]
+    counts = Counter(input_list)
+    return [item for item, count in counts.items() if count == 1]
+
+# Algorithm 4: Intersect a stream that is too big for memory with an in-memory set
+def iter_common_elements(stream, known):
+    # Yields each item of stream that is in known, once, in stream order. Memory is bounded
+    # by the size of known, never by the length of the stream.
+    known = known if isinstance(known, (set, frozenset)) else set(known)
+    seen = set()
+    for item in stream:
+        if item in known and item not in seen:
+            seen.add(item)
+            yield item
+
+# Algorithm 5: Approximate membership with a Bloom filter
+# A Python set costs 50-70 bytes per element. A Bloom filter stores only a bit array
+# (about 9.6 bits per item for a 1% false-positive rate): every item sets num_hashes bits,
+# and "in" answers False for sure or True with probability error_rate of a false positive.
+# Integers, NumPy integer scalars included, are hashed with splitmix64 (vectorized over
+# integer arrays and lists of ints in add_many and contains_many) and other keys with
+# blake2b. Both hashes are stable across processes, so a filter saved by one job can be
+# loaded by another.
+_MASK64 = (1 << 64) - 1
+_BLOOM_HEADER = struct.Struct("<8sQQQ")  # magic, num_bits, num_hashes, count
+_BLOOM_MAGIC = b"BLOOMv1\0"
+_BLOOM_BATCH = 1 << 20  # keys hashed per NumPy batch, bounds the temporary arrays
+
+def _splitmix64(x):
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+def _splitmix64_array(x):
+    # Same as _splitmix64 for a uint64 array (uint64 arithmetic wraps modulo 2**64)
+    with np.errstate(over="ignore"):
+        x = x + np.uint64(0x9E3779B97F4A7C15)
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=0.01):
+        # Size the bit array for capacity items at the requested false-positive rate
+        num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self._setup(num_bits, num_hashes, bytearray((num_bits + 7) // 8), 0)
+
+    def _setup(self, num_bits, num_hashes, bits, count):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits  # a bytearray, or a memoryview over a memory-mapped file
+        self.count = count  # number of add() calls, duplicates included
+
+    @classmethod
+    def _from_parts(cls, num_bits, num_hashes, bits, count=0):
+        bloom = cls.__new__(cls)
+        bloom._setup(num_bits, num_hashes, bits, count)
+        return bloom
+
+    def _positions(self, item):
+        if isinstance(item, numbers.Integral):  # int, bool and NumPy integer scalars alike
+            h1 = _splitmix64(operator.index(item) & _MASK64)
+            h2 = _splitmix64(h1) | 1
+        else:
+            if isinstance(item, str):
+                data = item.encode()
+            elif isinstance(item, bytes):
+                data = item
+            else:
+                data = repr(item).encode()
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            h1 = int.from_bytes(digest[:8], "little")
+            h2 = int.from_bytes(digest[8:], "little") | 1
+        return [((h1 + i * h2) & _MASK64) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def _array_positions(self, keys):
+        # Yield (batch slice, bit positions of hash i) for an integer array, batch by batch
+        keys = keys.astype(np.uint64).ravel()
+        for start in range(0, keys.size, _BLOOM_BATCH):
+            h1 = _splitmix64_array(keys[start:start + _BLOOM_BATCH])
+            h2 = _splitmix64_array(h1) | np.uint64(1)
+            for i in range(self.num_hashes):
+                with np.errstate(over="ignore"):
+                    yield start, (h1 + np.uint64(i) * h2) % np.uint64(self.num_bits)
+
+    def add_many(self, items):
+        keys = _integer_keys(items)
+        if keys is None:
+            for item in items:
+                self.add(item)
+            return
+        bits = np.frombuffer(self.bits, dtype=np.uint8)
+        for _, positions in self._array_positions(keys):
+            masks = np.left_shift(1, positions & np.uint64(7)).astype(np.uint8)
+            np.bitwise_or.at(bits, positions >> np.uint64(3), masks)
+        self.count += keys.size
+
+    def contains_many(self, items):
+        # Boolean array (or list without NumPy) answering "in" for every item
+        keys = _integer_keys(items)
+        if keys is None:
+            found = [item in self for item in items]
+            return np.array(found, dtype=bool) if np is not None else found
+        bits = np.frombuffer(self.bits, dtype=np.uint8)
+        found = np.ones(keys.size, dtype=bool)
+        for start, positions in self._array_positions(keys):
+            batch = found[start:start + _BLOOM_BATCH]
+            batch &= ((bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1).astype(bool)
+        return found
+
+    def _combine(self, other, combine_bytes):
+        if (self.num_bits, self.num_hashes) != (other.num_bits, other.num_hashes):
+            raise ValueError("Bloom filters must have the same size and number of hashes")
+        if np is not None:
+            bits = bytearray(combine_bytes(np.frombuffer(self.bits, dtype=np.uint8),
+                                           np.frombuffer(other.bits, dtype=np.uint8)).tobytes())
+        else:
+            size = len(self.bits)
+            value = combine_bytes(int.from_bytes(self.bits, "little"), int.from_bytes(other.bits, "little"))
+            bits = bytearray(value.to_bytes(size, "little"))
+        return BloomFilter._from_parts(self.num_bits, self.num_hashes, bits)
+
+    def union(self, other):
+        # Filter of everything added to either filter (exact, same as adding to one filter)
+        bloom = self._combine(other, lambda a, b: a | b)
+        bloom.count = self.count + other.count
+        return bloom
+
+    def intersection(self, other):
+        # Filter that answers True for items in both (with a higher false-positive rate)
+        return self._combine(other, lambda a, b: a & b)
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(_BLOOM_HEADER.pack(_BLOOM_MAGIC, self.num_bits, self.num_hashes, self.count))
+            file.write(self.bits)
+
+    @classmethod
+    def load(cls, path, writable=False):
+        # Memory-map a saved filter instead of reading it: pages are loaded on demand and
+        # shared between processes. With writable=True, added bits are written through to
+        # the file (the stored count is only updated by save()).
+        with open(path, "r+b" if writable else "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        magic, num_bits, num_hashes, count = _BLOOM_HEADER.unpack_from(mapped)
+        if magic != _BLOOM_MAGIC:
+            raise ValueError(f"{path} is not a saved BloomFilter")
+        bits = memoryview(mapped)[_BLOOM_HEADER.size:_BLOOM_HEADER.size + (num_bits + 7) // 8]
+        return cls._from_parts(num_bits, num_hashes, bits, count)
+
+def _integer_keys(items):
+    # items as an integer array for the vectorized hash (which gives the same bits as
+    # _positions), or None when they have to be hashed one by one
+    if np is None:
+        return None
+    if isinstance(items, np.ndarray):
+        return items if items.dtype.kind in "iu" else None
+    if not isinstance(items, (list, tuple, range)) or not items:
+        return None
+    if not all(isinstance(item, numbers.Integral) and not isinstance(item, bool) for item in items):
+        return None
+    # np.asarray would turn [-1, 2**63] into floats, so the dtype is picked from the range
+    low, high = min(items), max(items)
+    if -(1 << 63) <= low and high < 1 << 63:
+        return np.array(items, dtype=np.int64)
+    if 0 <= low and high < 1 << 64:
+        return np.array(items, dtype=np.uint64)
+    return None
+
+def main():
+    # Common Operations:
+    # Creating a set
+    my_set = {1, 2, 3, 4}
+    another_set = set([1, 2, 3, 4])
+
+    # Adding elements
+    my_set.add(5)
+    print(my_set)  # Output: {1, 2, 3, 4, 5}
+
+    # Removing elements
+    my_set.remove(3)
+    print(my_set)  # Output: {1, 2, 4, 5}
+
+    # Checking membership
+    print(2 in my_set)  # Output: True
+    print(3 in my_set)  # Output: False
+
+    # Set operations
+    set_a = {1, 2, 3}
+    set_b = {3, 4, 5}
+
+    # Union
+    print(set_a | set_b)  # Output: {1, 2, 3, 4, 5}
+
+    # Intersection
+    print(set_a & set_b)  # Output: {3}
+
+    # Difference
+    print(set_a - set_b)  # Output: {1, 2}
+
+    # Symmetric difference
+    print(set_a ^ set_b)  # Output: {1, 2, 4, 5}
+
+    # Example usage
+    input_list = [1, 2, 2, 3, 4, 4, 5]
+    print(remove_duplicates(input_list))  # Output: [1, 2, 3, 4, 5]
+
+    # Example usage
+    list1 = [1, 2, 3, 4]
+    list2 = [3, 4, 5, 6]
+    print(find_common_elements(list1, list2))  # Output: [3, 4]
+
+    # Example usage
+    input_list = [1, 2, 2, 3, 4, 4, 5]
+    print(find_unique_elements(input_list))  # Output: [1, 3, 5]
+
+    # Example usage
+    print(list(iter_common_elements(iter(range(10 ** 6)), {5, 999_999, -1})))  # Output: [5, 999999]
+
+    # Example usage
+    ids = BloomFilter(capacity=1000, error_rate=0.01)
+    ids.add_many(range(0, 1000, 2))
+    print(4 in ids, 5 in ids)  # Output: True False (5 could be a rare false positive)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Notes:
+# A tuple is an ordered, immutable collection of items.
+# Tuples can contain elements of different data types.
+# Tuples are defined using parentheses ().
+
+from operator import itemgetter
+
+from ._lazy import optional_import
+
+np = optional_import("numpy")  # NumPy is optional, only needed for array records
+
+# Algorithm 3: Swap two elements in a tuple (note: this creates a new tuple)
+def swap_elements(tup, i, j):
+    lst = list(tup)
+    lst[i], lst[j] = lst[j], lst[i]
+    return tuple(lst)
+
+# Algorithm 4: Apply many swaps (or any reordering) with a single copy
+# Every swap_elements call copies the whole tuple. Instead, the swaps are replayed on a
+# list of positions, and the tuple is rebuilt once with itemgetter, which runs in C.
+def compose_swaps(size, swaps):
+    # order[k] is the original position of the item that ends up at position k
+    order = list(range(size))
+    for i, j in swaps:
+        order[i], order[j] = order[j], order[i]
+    return order
+
+def permute(tup, order):
+    if len(order) == 0:
+        return ()
+    if len(order) == 1:
+        return (tup[order[0]],)
+    return itemgetter(*order)(tup)
+
+def apply_swaps(tup, swaps):
+    return permute(tup, compose_swaps(len(tup), swaps))
+
+# Algorithm 5: Permutation views that only copy when asked to
+class PermutedView:
+    # Read-only view of seq in the given order; swap() only touches the order list
+    def __init__(self, seq, order=None):
+        self.seq = seq
+        self.order = list(range(len(seq))) if order is None else list(order)
+
+    def swap(self, i, j):
+        self.order[i], self.order[j] = self.order[j], self.order[i]
+        return self
+
+    def __len__(self):
+        return len(self.order)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PermutedView(self.seq, self.order[index])
+        return self.seq[self.order[index]]
+
+    def __iter__(self):
+        return map(self.seq.__getitem__, self.order)
+
+    def materialize(self):
+        return permute(self.seq, self.order)
+
+    def __repr__(self):
+        return f"PermutedView({self.materialize()!r})"
+
+# Algorithm 6: Reorder NumPy records in place
+# axis=0 reorders the records of an array (structured arrays included), axis=1 reorders
+# the fields of every record of a 2D table at once. The gather makes one temporary copy,
+# which is then written back into the same buffer, so views of records stay valid.
+def permute_records(records, order, axis=0):
+    records[...] = np.take(records, np.asarray(order, dtype=np.intp), axis=axis)
+    return records
+
+def swap_records(records, swaps, axis=0):
+    return permute_records(records, compose_swaps(records.shape[axis], swaps), axis=axis)
+
+def main():
+    # Common Operations:
+    # Creating a tuple
+    my_tuple = (1, 2, 3, 4)
+
+    # Accessing elements
+    print(my_tuple[0])  # Output: 1
+
+    # Slicing a tuple
+    print(my_tuple[1:3])  # Output: (2, 3)
+
+    # Unpacking a tuple
+    (a, b, c, d) = my_tuple
+    print(a, b, c, d)  # Output: 1 2 3 4
+
+    # Note: Tuples are immutable, so elements cannot be added or removed.
+
+    # Example usage
+    tup = (1, 2, 3, 4)
+    print(swap_elements(tup, 1, 3))  # Output: (1, 4, 3, 2)
+
+    # Example usage
+    print(apply_swaps((1, 2, 3, 4), [(1, 3), (0, 1)]))  # Output: (4, 1, 3, 2)
+
+    # Example usage
+    view = PermutedView(tup).swap(1, 3).swap(0, 1)
+    print(view[0], view.materialize())  # Output: 4 (4, 1, 3, 2)
+
+    # Example usage
+    if np is not None:
+        data = np.array([(1, 'A', 2.5), (2, 'B', 3.6)], dtype=[('id', 'i4'), ('name', 'U10'), ('value', 'f4')])
+        print(swap_records(data, [(0, 1)])['id'])  # Output: [2 1]
+
+if __name__ == "__main__":
+    main()